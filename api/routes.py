@@ -1,11 +1,11 @@
 """API route handlers."""
-import json
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, HTTPException, status, Header
+from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, status, Header, Response
 from pydantic import BaseModel, Field
 
 from core.workflow_manager import WorkflowManager
 from models.workflow import WorkflowStatus
+from utils.json_codec import LazyJson
 from utils.logger import get_logger
 
 
@@ -15,6 +15,9 @@ router = APIRouter()
 # Global workflow manager instance
 workflow_manager: WorkflowManager = None
 
+# Statuses from which a workflow can still be cancelled
+CANCELLABLE_STATUSES = ['planned', 'pending', 'queued', 'running']
+
 
 def _sanitize_incoming_workflow_payload(workflow_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -56,6 +59,12 @@ class SubmitResponse(BaseModel):
     message: str = "Workflow submitted successfully"
 
 
+class BatchSubmitResponse(BaseModel):
+    """Response model for batch workflow submission."""
+    workflows: List[SubmitResponse]
+    message: str = "Workflows submitted successfully"
+
+
 class PlanResponse(BaseModel):
     """Response model for workflow planning."""
     workflow_id: str
@@ -74,6 +83,12 @@ class RegisterResponse(BaseModel):
     message: str = "Workflow registered successfully"
 
 
+class BatchRegisterResponse(BaseModel):
+    """Response model for batch workflow registration."""
+    workflows: List[RegisterResponse]
+    message: str = "Workflows registered successfully"
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
     status: str
@@ -107,7 +122,7 @@ async def register_workflow(
         workflow_data = _sanitize_incoming_workflow_payload(workflow_data)
         logger.info(
             "Full workflow registration data:\n%s",
-            json.dumps(workflow_data, indent=2)
+            LazyJson(workflow_data)
         )
 
         auth_token = authorization
@@ -133,6 +148,53 @@ async def register_workflow(
         )
 
 
+@router.post(
+    "/workflows/register/batch",
+    response_model=BatchRegisterResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Register several workflows",
+    description="Validate a list of workflows and persist them with planned status "
+                "using a single bulk write. If any workflow fails validation, none are registered."
+)
+async def register_workflows_batch(
+    workflow_data: List[Dict[str, Any]],
+    authorization: Optional[str] = Header(None, alias="Authorization")
+) -> BatchRegisterResponse:
+    """Register and persist several workflows without execution side effects."""
+    try:
+        logger.info(
+            "Received batch registration request for %d workflows",
+            len(workflow_data)
+        )
+        workflows = [_sanitize_incoming_workflow_payload(item) for item in workflow_data]
+
+        results = workflow_manager.register_workflows_bulk(workflows, auth_token=authorization)
+
+        return BatchRegisterResponse(
+            workflows=[
+                RegisterResponse(
+                    workflow_id=result["workflow_id"],
+                    status=result["status"],
+                    workflow_name=result["workflow_name"],
+                    step_count=result["step_count"]
+                )
+                for result in results
+            ]
+        )
+    except ValueError as e:
+        logger.error(f"Workflow registration validation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Batch workflow registration failed: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
 @router.post(
     "/workflows/plan",
     response_model=PlanResponse,
@@ -150,7 +212,7 @@ async def plan_workflow(
         workflow_data = _sanitize_incoming_workflow_payload(workflow_data)
         logger.info(
             "Full workflow planning data:\n%s",
-            json.dumps(workflow_data, indent=2)
+            LazyJson(workflow_data)
         )
 
         auth_token = authorization
@@ -189,7 +251,7 @@ async def submit_planned_workflow(
 ) -> SubmitResponse:
     """Submit an existing planned workflow by ID."""
     try:
-        logger.info(f"Received planned workflow submission request for {workflow_id}")
+        logger.info("Received planned workflow submission request for %s", workflow_id)
         auth_token = authorization
         result = workflow_manager.submit_planned_workflow(workflow_id, auth_token=auth_token)
         return SubmitResponse(
@@ -239,14 +301,12 @@ async def submit_workflow(
         workflow_data = _sanitize_incoming_workflow_payload(workflow_data)
 
         # Log the full incoming workflow data for debugging
-        logger.info(
-            f"Full workflow submission data:\n{json.dumps(workflow_data, indent=2)}"
-        )
+        logger.info("Full workflow submission data:\n%s", LazyJson(workflow_data))
 
         # Extract auth token from Authorization header if provided
         auth_token = authorization
 
-        result = workflow_manager.submit_workflow(workflow_data, auth_token=auth_token)
+        result = await workflow_manager.submit_workflow_async(workflow_data, auth_token=auth_token)
 
         return SubmitResponse(
             workflow_id=result['workflow_id'],
@@ -267,6 +327,63 @@ async def submit_workflow(
         )
 
 
+@router.post(
+    "/workflows/submit/batch",
+    response_model=BatchSubmitResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Validate and submit several workflow specs",
+    description="Validate a list of workflow specifications and submit them for execution "
+                "with a single bulk write. If any workflow fails validation, none are submitted."
+)
+async def submit_workflows_batch(
+    workflow_data: List[Dict[str, Any]],
+    authorization: Optional[str] = Header(None, alias="Authorization")
+) -> BatchSubmitResponse:
+    """Validate and submit several workflows at once.
+
+    Args:
+        workflow_data: List of workflow specification payloads
+        authorization: Optional authorization token in Authorization header
+
+    Returns:
+        Batch submission response with one entry per workflow, in input order
+
+    Raises:
+        HTTPException: 400 for validation errors, 500 for server errors
+    """
+    try:
+        logger.info(
+            "Received batch submission request for %d workflows",
+            len(workflow_data)
+        )
+        workflows = [_sanitize_incoming_workflow_payload(item) for item in workflow_data]
+
+        results = await workflow_manager.submit_workflows_bulk_async(
+            workflows,
+            auth_token=authorization
+        )
+
+        return BatchSubmitResponse(
+            workflows=[
+                SubmitResponse(workflow_id=result['workflow_id'], status=result['status'])
+                for result in results
+            ]
+        )
+
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"Batch workflow submission failed: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
 @router.post(
     "/workflows/validate",
     response_model=ValidateResponse,
@@ -297,7 +414,7 @@ async def validate_workflow(
         workflow_data = _sanitize_incoming_workflow_payload(workflow_data)
         logger.info(
             "Full workflow validation data (pre-validation):\n%s",
-            json.dumps(workflow_data, indent=2)
+            LazyJson(workflow_data)
         )
         auth_token = authorization
 
@@ -334,24 +451,31 @@ async def validate_workflow(
     summary="Get workflow status",
     description="Retrieve the current status of a workflow by its ID."
 )
-async def get_workflow_status(workflow_id: str) -> WorkflowStatus:
+async def get_workflow_status(workflow_id: str) -> Response:
     """Get status of a workflow.
 
+    The status model is serialized straight to JSON bytes; returning a
+    Response skips FastAPI's dump/re-validate/serialize pass over
+    response_model, which is kept for the OpenAPI schema only.
+
     Args:
         workflow_id: Workflow identifier
 
     Returns:
-        Workflow status information
+        JSON response with workflow status information
 
     Raises:
         HTTPException: 404 if not found, 500 for server errors
     """
     try:
-        logger.info(f"Received status request for workflow {workflow_id}")
+        logger.info("Received status request for workflow %s", workflow_id)
 
-        status_info = workflow_manager.get_workflow_status(workflow_id)
+        status_info = await workflow_manager.get_workflow_status_async(workflow_id)
 
-        return status_info
+        return Response(
+            content=status_info.model_dump_json(),
+            media_type="application/json"
+        )
 
     except ValueError as e:
         logger.error(f"Workflow not found: {e}")
@@ -385,7 +509,7 @@ async def get_workflow(workflow_id: str) -> Dict[str, Any]:
         HTTPException: 404 if not found, 500 for server errors
     """
     try:
-        logger.info(f"Received full workflow request for {workflow_id}")
+        logger.info("Received full workflow request for %s", workflow_id)
 
         workflow = workflow_manager.get_full_workflow(workflow_id)
 
@@ -437,7 +561,7 @@ async def submit_cwl_workflow(
         # Extract auth token from Authorization header if provided
         auth_token = authorization
 
-        result = workflow_manager.submit_cwl_workflow(workflow_data, auth_token=auth_token)
+        result = await workflow_manager.submit_cwl_workflow_async(workflow_data, auth_token=auth_token)
 
         return SubmitResponse(
             workflow_id=result['workflow_id'],
@@ -478,7 +602,7 @@ async def cancel_workflow(workflow_id: str) -> Dict[str, Any]:
         HTTPException: 404 if not found, 400 if already completed, 500 for errors
     """
     try:
-        logger.info(f"Received cancellation request for workflow {workflow_id}")
+        logger.info("Received cancellation request for workflow %s", workflow_id)
 
         # Get workflow
         workflow = workflow_manager.get_full_workflow(workflow_id)
@@ -492,10 +616,20 @@ async def cancel_workflow(workflow_id: str) -> Dict[str, Any]:
                 detail=f"Cannot cancel workflow with status '{current_status}'"
             )
 
-        # Update status to cancelled
-        workflow_manager.update_workflow_status(workflow_id, 'cancelled')
+        # Update status to cancelled; guarded so a workflow that finished
+        # since the read above is not overwritten
+        cancelled = workflow_manager.update_workflow_status(
+            workflow_id,
+            'cancelled',
+            allowed_current_statuses=CANCELLABLE_STATUSES
+        )
+        if not cancelled:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot cancel workflow: it reached a terminal state"
+            )
 
-        logger.info(f"Workflow {workflow_id} marked as cancelled")
+        logger.info("Workflow %s marked as cancelled", workflow_id)
 
         return {
             "workflow_id": workflow_id,
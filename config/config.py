@@ -55,6 +55,14 @@ class Config:
             self._config['api']['host'] = os.getenv('API_HOST')
         if os.getenv('API_PORT'):
             self._config['api']['port'] = int(os.getenv('API_PORT'))
+        
+        # Security overrides
+        if os.getenv('AUTH_TOKEN_ENCRYPTION_KEY'):
+            self._config.setdefault('security', {})['auth_token_key'] = os.getenv('AUTH_TOKEN_ENCRYPTION_KEY')
+        
+        # Redis overrides
+        if os.getenv('REDIS_URL'):
+            self._config.setdefault('redis', {})['url'] = os.getenv('REDIS_URL')
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by dot-notation key.
@@ -95,6 +103,16 @@ class Config:
         """Get scheduler configuration."""
         return self._config.get('scheduler', {})
     
+    @property
+    def redis(self) -> Dict[str, Any]:
+        """Get Redis cache configuration."""
+        return self._config.get('redis') or {}
+    
+    @property
+    def security(self) -> Dict[str, Any]:
+        """Get security configuration."""
+        return self._config.get('security') or {}
+    
     @property
     def logging(self) -> Dict[str, Any]:
         """Get logging configuration."""
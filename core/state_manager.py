@@ -1,8 +1,8 @@
 """MongoDB state management for workflows."""
-from typing import Optional, Dict, Any, List
-from pymongo import MongoClient, ASCENDING
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Set
+from pymongo import MongoClient, ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError
+from datetime import datetime, timezone
 
 from config.config import config
 from utils.logger import get_logger
@@ -11,6 +11,32 @@ from models.workflow import WorkflowSubmission
 
 logger = get_logger(__name__)
 
+# Fields read by the workflow status endpoint
+STATUS_PROJECTION = {
+    "_id": 0,
+    "workflow_id": 1,
+    "workflow_name": 1,
+    "status": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "steps.step_id": 1,
+    "steps.task_id": 1,
+    "steps.step_name": 1,
+    "steps.status": 1,
+    "steps.app": 1,
+}
+
+# Status fields that can change after a workflow leaves 'planned'
+MUTABLE_STATUS_PROJECTION = {
+    "_id": 0,
+    "workflow_id": 1,
+    "status": 1,
+    "updated_at": 1,
+    "steps.step_id": 1,
+    "steps.task_id": 1,
+    "steps.status": 1,
+}
+
 
 class StateManager:
     """Manages workflow state in MongoDB."""
@@ -20,6 +46,8 @@ class StateManager:
         self.client: Optional[MongoClient] = None
         self.db = None
         self.collection = None
+        self.auth_collection = None
+        self.executor_state_collection = None
         self._connect()
     
     def _connect(self):
@@ -42,10 +70,13 @@ class StateManager:
             else:
                 connection_string = f"mongodb://{host}:{port}/"
             
-            logger.info(f"Connecting to MongoDB at {host}:{port}")
+            logger.info("Connecting to MongoDB at %s:%s", host, port)
+            # tz_aware so stored datetimes read back as aware UTC values,
+            # matching the datetime.now(timezone.utc) values written everywhere
             self.client = MongoClient(
                 connection_string,
-                serverSelectionTimeoutMS=5000
+                serverSelectionTimeoutMS=5000,
+                tz_aware=True
             )
             
             # Test connection
@@ -55,8 +86,14 @@ class StateManager:
             db_name = mongo_config.get('database', 'workflow_engine_db')
             collection_name = mongo_config.get('collection', 'workflows')
             
+            auth_collection_name = mongo_config.get('auth_collection', 'workflow_auth')
+            
             self.db = self.client[db_name]
             self.collection = self.db[collection_name]
+            self.auth_collection = self.db[auth_collection_name]
+            self.executor_state_collection = self.db[
+                mongo_config.get('executor_state_collection', 'executor_state')
+            ]
             
             # Create index on workflow_id for fast lookups
             self.collection.create_index(
@@ -64,10 +101,23 @@ class StateManager:
                 unique=True
             )
             
-            logger.info(
-                f"Connected to MongoDB: {db_name}.{collection_name}"
+            # Executor pickup queries filter on status and sort by created_at;
+            # equality column first, sort column second. This also serves the
+            # resume sweep (status $in active). execution_metadata.* is rewritten
+            # on every step transition and never queried, so it is deliberately
+            # left unindexed to avoid index writes on the hot update path.
+            self.collection.create_index(
+                [("status", ASCENDING), ("created_at", DESCENDING)]
+            )
+            
+            # Auth tokens live in their own collection, one document per workflow
+            self.auth_collection.create_index(
+                [("workflow_id", ASCENDING)],
+                unique=True
             )
             
+            logger.info("Connected to MongoDB: %s.%s", db_name, collection_name)
+            
         except ConnectionFailure as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise
@@ -75,44 +125,316 @@ class StateManager:
             logger.error(f"Error initializing MongoDB: {e}")
             raise
     
-    def save_workflow(self, workflow_data: Dict[str, Any]) -> str:
+    def save_workflow(
+        self,
+        workflow_data: Dict[str, Any],
+        auth_fields: Optional[Dict[str, Any]] = None
+    ) -> str:
         """Save workflow to MongoDB.
         
+        When auth_fields are given, the auth document is written before the
+        workflow (the executor may pick up a pending workflow as soon as it
+        is inserted), but only if none exists yet, and it is removed again
+        if the insert fails. An existing workflow's token is never replaced.
+        
         Args:
             workflow_data: Workflow data dictionary
+            auth_fields: Optional token fields from AuthTokenCipher.protect()
             
         Returns:
             workflow_id of saved workflow
             
         Raises:
-            DuplicateKeyError: If workflow_id already exists
+            ValueError: If workflow_id already exists
             Exception: For other database errors
         """
+        workflow_id = workflow_data.get('workflow_id')
+        claimed: Set[str] = set()
         try:
-            workflow_id = workflow_data.get('workflow_id')
-            logger.info(f"Saving workflow {workflow_id} to MongoDB")
+            logger.info("Saving workflow %s to MongoDB", workflow_id)
             
             # Ensure timestamps
-            if 'created_at' not in workflow_data:
-                workflow_data['created_at'] = datetime.utcnow()
-            if 'updated_at' not in workflow_data:
-                workflow_data['updated_at'] = datetime.utcnow()
+            now = datetime.now(timezone.utc)
+            workflow_data.setdefault('created_at', now)
+            workflow_data.setdefault('updated_at', now)
+            
+            if auth_fields:
+                claimed = self._claim_workflow_auths([workflow_id], auth_fields)
             
             # Insert document
             result = self.collection.insert_one(workflow_data)
             
             logger.info(
-                f"Workflow {workflow_id} saved with _id: {result.inserted_id}"
+                "Workflow %s saved with _id: %s",
+                workflow_id, result.inserted_id
             )
             return workflow_id
             
         except DuplicateKeyError:
+            self._release_workflow_auths(claimed)
             logger.error(f"Workflow {workflow_id} already exists")
             raise ValueError(f"Workflow {workflow_id} already exists")
         except Exception as e:
             logger.error(f"Error saving workflow: {e}")
             raise
     
+    def save_workflows_bulk(
+        self,
+        workflows: List[Dict[str, Any]],
+        auth_fields: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """Save several workflows to MongoDB in a single round-trip.
+        
+        The batch is all-or-nothing: the unordered insert_many writes every
+        document it can, so if any document is rejected the ones that were
+        inserted are deleted again before the error is raised, and no
+        partial batch is left for the executor to run. Auth fields are
+        stored the same way as in save_workflow(): only where no auth
+        document exists, and removed again when the batch fails.
+        
+        Args:
+            workflows: List of workflow data dictionaries
+            auth_fields: Optional token fields from AuthTokenCipher.protect(),
+                stored for every workflow
+            
+        Returns:
+            workflow_ids of the submitted workflows, in input order
+            
+        Raises:
+            ValueError: If any workflow_id already exists (nothing is persisted)
+            Exception: For other database errors
+        """
+        if not workflows:
+            return []
+        
+        claimed: Set[str] = set()
+        try:
+            logger.info("Saving %d workflows to MongoDB", len(workflows))
+            
+            now = datetime.now(timezone.utc)
+            for workflow_data in workflows:
+                workflow_data.setdefault('created_at', now)
+                workflow_data.setdefault('updated_at', now)
+            
+            if auth_fields:
+                claimed = self._claim_workflow_auths(
+                    [workflow_data.get('workflow_id') for workflow_data in workflows],
+                    auth_fields
+                )
+            
+            result = self.collection.insert_many(workflows, ordered=False)
+            
+            logger.info("Saved %d workflows", len(result.inserted_ids))
+            return [workflow_data.get('workflow_id') for workflow_data in workflows]
+            
+        except BulkWriteError as e:
+            write_errors = e.details.get('writeErrors', [])
+            self._rollback_bulk_insert(workflows, claimed)
+            duplicates = [
+                error.get('op', {}).get('workflow_id')
+                for error in write_errors
+                if error.get('code') == 11000
+            ]
+            logger.error(f"Bulk workflow save failed: {write_errors}")
+            if duplicates:
+                raise ValueError(f"Workflows already exist: {', '.join(map(str, duplicates))}")
+            raise
+        except Exception as e:
+            logger.error(f"Error saving workflows: {e}")
+            self._rollback_bulk_insert(workflows, claimed)
+            raise
+    
+    def _rollback_bulk_insert(self, workflows: List[Dict[str, Any]], claimed: Set[str]) -> None:
+        """Remove whatever a failed bulk insert did write.
+        
+        Documents are deleted by the _id insert_many assigned to them, so
+        only this batch's documents can match; rejected ones were never
+        written and are simply not found.
+        
+        Args:
+            workflows: Workflow documents passed to insert_many
+            claimed: Workflow IDs whose auth documents this batch created
+        """
+        object_ids = [
+            workflow_data['_id']
+            for workflow_data in workflows
+            if '_id' in workflow_data
+        ]
+        if object_ids:
+            try:
+                result = self.collection.delete_many({"_id": {"$in": object_ids}})
+                logger.info(
+                    "Rolled back %d workflows from a failed bulk insert",
+                    result.deleted_count
+                )
+            except Exception as e:
+                logger.error(f"Error rolling back failed bulk insert: {e}")
+        
+        self._release_workflow_auths(claimed)
+    
+    def save_workflow_auth(self, workflow_id: str, auth_fields: Dict[str, Any]) -> None:
+        """Store (or replace) the auth token fields for a workflow.
+        
+        Args:
+            workflow_id: Workflow identifier
+            auth_fields: Token fields from AuthTokenCipher.protect()
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            self.auth_collection.update_one(
+                {"workflow_id": workflow_id},
+                {
+                    "$set": {**auth_fields, "updated_at": now},
+                    "$setOnInsert": {"created_at": now}
+                },
+                upsert=True
+            )
+            logger.debug("Stored auth token for workflow %s", workflow_id)
+            
+        except Exception as e:
+            logger.error(f"Error storing auth token for workflow {workflow_id}: {e}")
+            raise
+    
+    def save_workflow_auths_bulk(self, auth_by_workflow: Dict[str, Dict[str, Any]]) -> None:
+        """Store auth token fields for several workflows in a single round-trip.
+        
+        Args:
+            auth_by_workflow: Mapping of workflow_id to AuthTokenCipher.protect() fields
+        """
+        if not auth_by_workflow:
+            return
+        
+        try:
+            now = datetime.now(timezone.utc)
+            self.auth_collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"workflow_id": workflow_id},
+                        {
+                            "$set": {**auth_fields, "updated_at": now},
+                            "$setOnInsert": {"created_at": now}
+                        },
+                        upsert=True
+                    )
+                    for workflow_id, auth_fields in auth_by_workflow.items()
+                ],
+                ordered=False
+            )
+            logger.debug("Stored auth tokens for %d workflows", len(auth_by_workflow))
+            
+        except Exception as e:
+            logger.error(f"Error storing auth tokens: {e}")
+            raise
+    
+    def _claim_workflow_auths(
+        self,
+        workflow_ids: List[str],
+        auth_fields: Dict[str, Any]
+    ) -> Set[str]:
+        """Store auth token fields for workflows that have no auth document yet.
+        
+        Existing auth documents are left untouched, so a submission reusing
+        another workflow's ID cannot replace that workflow's token.
+        
+        Args:
+            workflow_ids: Workflow identifiers
+            auth_fields: Token fields from AuthTokenCipher.protect()
+            
+        Returns:
+            Set of workflow_ids whose auth document was created by this call
+        """
+        if not workflow_ids:
+            return set()
+        
+        try:
+            now = datetime.now(timezone.utc)
+            result = self.auth_collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"workflow_id": workflow_id},
+                        {
+                            "$setOnInsert": {
+                                **auth_fields,
+                                "created_at": now,
+                                "updated_at": now
+                            }
+                        },
+                        upsert=True
+                    )
+                    for workflow_id in workflow_ids
+                ],
+                ordered=False
+            )
+            claimed = {workflow_ids[index] for index in result.upserted_ids}
+            logger.debug("Stored auth tokens for %d workflows", len(claimed))
+            return claimed
+            
+        except Exception as e:
+            logger.error(f"Error storing auth tokens: {e}")
+            raise
+    
+    def _release_workflow_auths(self, workflow_ids: Set[str]) -> None:
+        """Remove auth documents claimed for workflows that were not inserted.
+        
+        Args:
+            workflow_ids: Workflow identifiers returned by _claim_workflow_auths()
+        """
+        if not workflow_ids:
+            return
+        
+        try:
+            self.auth_collection.delete_many(
+                {"workflow_id": {"$in": list(workflow_ids)}}
+            )
+            logger.debug("Removed auth tokens for %d unsaved workflows", len(workflow_ids))
+            
+        except Exception as e:
+            logger.error(f"Error removing auth tokens for unsaved workflows: {e}")
+    
+    def get_workflow_auth(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve the stored auth token fields for a workflow.
+        
+        Args:
+            workflow_id: Workflow identifier
+            
+        Returns:
+            Auth document or None if no token was stored
+        """
+        try:
+            return self.auth_collection.find_one(
+                {"workflow_id": workflow_id},
+                {"_id": 0}
+            )
+            
+        except Exception as e:
+            logger.error(f"Error retrieving auth token for workflow {workflow_id}: {e}")
+            raise
+    
+    def get_workflow_auths(self, workflow_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve stored auth token fields for several workflows in one query.
+        
+        Args:
+            workflow_ids: Workflow identifiers
+            
+        Returns:
+            Mapping of workflow_id to auth document for workflows that have one
+        """
+        if not workflow_ids:
+            return {}
+        
+        try:
+            return {
+                auth_doc['workflow_id']: auth_doc
+                for auth_doc in self.auth_collection.find(
+                    {"workflow_id": {"$in": list(workflow_ids)}},
+                    {"_id": 0}
+                )
+            }
+            
+        except Exception as e:
+            logger.error(f"Error retrieving auth tokens: {e}")
+            raise
+    
     def get_workflow(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve workflow by ID.
         
@@ -123,16 +445,16 @@ class StateManager:
             Workflow document or None if not found
         """
         try:
-            logger.debug(f"Retrieving workflow {workflow_id}")
+            logger.debug("Retrieving workflow %s", workflow_id)
             workflow = self.collection.find_one(
                 {"workflow_id": workflow_id},
                 {"_id": 0}  # Exclude MongoDB _id from result
             )
             
             if workflow:
-                logger.debug(f"Found workflow {workflow_id}")
+                logger.debug("Found workflow %s", workflow_id)
             else:
-                logger.debug(f"Workflow {workflow_id} not found")
+                logger.debug("Workflow %s not found", workflow_id)
             
             return workflow
             
@@ -140,41 +462,139 @@ class StateManager:
             logger.error(f"Error retrieving workflow {workflow_id}: {e}")
             raise
     
+    def get_workflow_status_fields(
+        self,
+        workflow_id: str,
+        projection: Optional[Dict[str, int]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve only the fields needed to report workflow status.
+        
+        Skips params, outputs and execution metadata so status polls do not
+        pull the whole document over the wire.
+        
+        Args:
+            workflow_id: Workflow identifier
+            projection: Fields to read (defaults to STATUS_PROJECTION)
+            
+        Returns:
+            Projected workflow document or None if not found
+        """
+        try:
+            logger.debug("Retrieving status fields for workflow %s", workflow_id)
+            return self.collection.find_one(
+                {"workflow_id": workflow_id},
+                projection or STATUS_PROJECTION
+            )
+            
+        except Exception as e:
+            logger.error(f"Error retrieving workflow {workflow_id} status fields: {e}")
+            raise
+    
+    def get_workflows_by_ids(self, workflow_ids: List[str]) -> List[Dict[str, Any]]:
+        """Retrieve several workflows in a single query.
+        
+        Args:
+            workflow_ids: Workflow identifiers
+            
+        Returns:
+            Workflow documents that exist (order not guaranteed)
+        """
+        if not workflow_ids:
+            return []
+        
+        try:
+            workflows = list(
+                self.collection.find(
+                    {"workflow_id": {"$in": list(workflow_ids)}},
+                    {"_id": 0}
+                )
+            )
+            
+            logger.debug(
+                "Retrieved %d of %d workflows",
+                len(workflows), len(workflow_ids)
+            )
+            return workflows
+            
+        except Exception as e:
+            logger.error(f"Error retrieving workflows by id: {e}")
+            raise
+    
     def update_workflow_status(
         self, 
         workflow_id: str, 
-        status: str
-    ) -> bool:
-        """Update workflow status.
+        status: str,
+        allowed_current_statuses: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Update workflow status atomically.
+        
+        The check and the write happen in a single find_one_and_update, so a
+        transition guarded by allowed_current_statuses cannot race another
+        writer (e.g. a cancel landing while the executor queues the workflow).
+        A workflow already in the target status is left untouched, so
+        repeated reports of the same state cost no write.
         
         Args:
             workflow_id: Workflow identifier
             status: New status value
+            allowed_current_statuses: Only update if the current status is one
+                of these (None allows any transition)
             
         Returns:
-            True if updated, False if not found
+            Updated {workflow_id, status} document, or None if the workflow was
+            not found or its current status is not allowed
         """
         try:
-            logger.info(
-                f"Updating workflow {workflow_id} status to {status}"
-            )
+            logger.info("Updating workflow %s status to %s", workflow_id, status)
             
-            result = self.collection.update_one(
-                {"workflow_id": workflow_id},
+            projection = {"_id": 0, "workflow_id": 1, "status": 1}
+            status_filter: Dict[str, Any] = {"$ne": status}
+            if allowed_current_statuses is not None:
+                status_filter["$in"] = list(allowed_current_statuses)
+            
+            result = self.collection.find_one_and_update(
+                {"workflow_id": workflow_id, "status": status_filter},
                 {
                     "$set": {
                         "status": status,
-                        "updated_at": datetime.utcnow()
+                        "updated_at": datetime.now(timezone.utc)
                     }
-                }
+                },
+                projection=projection,
+                return_document=ReturnDocument.AFTER
             )
             
-            if result.matched_count == 0:
-                logger.warning(f"Workflow {workflow_id} not found for update")
-                return False
+            if result is None:
+                # No match may just mean the status is already current
+                current = self.collection.find_one(
+                    {"workflow_id": workflow_id},
+                    projection
+                )
+                if (
+                    current is not None
+                    and current.get("status") == status
+                    and (
+                        allowed_current_statuses is None
+                        or status in allowed_current_statuses
+                    )
+                ):
+                    logger.debug(
+                        "Workflow %s already %s - skipping write",
+                        workflow_id, status
+                    )
+                    return current
+                
+                logger.warning(
+                    f"Workflow {workflow_id} not found for update"
+                    + (
+                        f" in status {allowed_current_statuses}"
+                        if allowed_current_statuses is not None else ""
+                    )
+                )
+                return None
             
-            logger.info(f"Workflow {workflow_id} status updated")
-            return True
+            logger.info("Workflow %s status updated", workflow_id)
+            return result
             
         except Exception as e:
             logger.error(
@@ -200,8 +620,8 @@ class StateManager:
         """
         try:
             logger.info(
-                f"Updating step {step_id} in workflow {workflow_id} "
-                f"status to {status}"
+                "Updating step %s in workflow %s status to %s",
+                step_id, workflow_id, status
             )
             
             result = self.collection.update_one(
@@ -212,7 +632,7 @@ class StateManager:
                 {
                     "$set": {
                         "steps.$.status": status,
-                        "updated_at": datetime.utcnow()
+                        "updated_at": datetime.now(timezone.utc)
                     }
                 }
             )
@@ -223,7 +643,7 @@ class StateManager:
                 )
                 return False
             
-            logger.info(f"Step {step_id} status updated")
+            logger.info("Step %s status updated", step_id)
             return True
             
         except Exception as e:
@@ -261,7 +681,7 @@ class StateManager:
                 .limit(limit)
             )
             
-            logger.debug(f"Retrieved {len(workflows)} workflows")
+            logger.debug("Retrieved %d workflows", len(workflows))
             return workflows
             
         except Exception as e:
@@ -285,7 +705,7 @@ class StateManager:
                 .sort("created_at", -1)
             )
             
-            logger.debug(f"Retrieved {len(workflows)} active workflows")
+            logger.debug("Retrieved %d active workflows", len(workflows))
             return workflows
             
         except Exception as e:
@@ -310,7 +730,10 @@ class StateManager:
                 .sort("created_at", -1)
             )
             
-            logger.debug(f"Retrieved {len(workflows)} workflows with status={status}")
+            logger.debug(
+                "Retrieved %d workflows with status=%s",
+                len(workflows), status
+            )
             return workflows
             
         except Exception as e:
@@ -335,7 +758,8 @@ class StateManager:
         """
         try:
             logger.debug(
-                f"Updating step {step_id} in workflow {workflow_id}: {updates.keys()}"
+                "Updating step %s in workflow %s: %s",
+                step_id, workflow_id, updates.keys()
             )
             
             # Build update dict with $ positional operator
@@ -343,7 +767,7 @@ class StateManager:
                 f"steps.$.{key}": value
                 for key, value in updates.items()
             }
-            set_updates["updated_at"] = datetime.utcnow()
+            set_updates["updated_at"] = datetime.now(timezone.utc)
             
             result = self.collection.update_one(
                 {
@@ -359,7 +783,7 @@ class StateManager:
                 )
                 return False
             
-            logger.debug(f"Step {step_id} fields updated successfully")
+            logger.debug("Step %s fields updated successfully", step_id)
             return True
             
         except Exception as e:
@@ -384,7 +808,8 @@ class StateManager:
         """
         try:
             logger.debug(
-                f"Updating step '{step_name}' in workflow {workflow_id}: {updates.keys()}"
+                "Updating step '%s' in workflow %s: %s",
+                step_name, workflow_id, updates.keys()
             )
             
             # Build update dict with $ positional operator
@@ -392,7 +817,7 @@ class StateManager:
                 f"steps.$.{key}": value
                 for key, value in updates.items()
             }
-            set_updates["updated_at"] = datetime.utcnow()
+            set_updates["updated_at"] = datetime.now(timezone.utc)
             
             result = self.collection.update_one(
                 {
@@ -408,7 +833,7 @@ class StateManager:
                 )
                 return False
             
-            logger.debug(f"Step '{step_name}' fields updated successfully")
+            logger.debug("Step '%s' fields updated successfully", step_name)
             return True
             
         except Exception as e:
@@ -440,7 +865,7 @@ class StateManager:
                         "execution_metadata.running_steps": 1
                     },
                     "$set": {
-                        "updated_at": datetime.utcnow()
+                        "updated_at": datetime.now(timezone.utc)
                     }
                 }
             )
@@ -449,7 +874,7 @@ class StateManager:
                 logger.warning(f"Workflow {workflow_id} not found")
                 return False
             
-            logger.debug(f"Added step {step_id} to running steps")
+            logger.debug("Added step %s to running steps", step_id)
             return True
             
         except Exception as e:
@@ -481,7 +906,7 @@ class StateManager:
                         "execution_metadata.running_steps": -1
                     },
                     "$set": {
-                        "updated_at": datetime.utcnow()
+                        "updated_at": datetime.now(timezone.utc)
                     }
                 }
             )
@@ -490,7 +915,7 @@ class StateManager:
                 logger.warning(f"Workflow {workflow_id} not found")
                 return False
             
-            logger.debug(f"Removed step {step_id} from running steps")
+            logger.debug("Removed step %s from running steps", step_id)
             return True
             
         except Exception as e:
@@ -522,7 +947,7 @@ class StateManager:
                         "execution_metadata.completed_steps": 1
                     },
                     "$set": {
-                        "updated_at": datetime.utcnow()
+                        "updated_at": datetime.now(timezone.utc)
                     }
                 }
             )
@@ -531,13 +956,126 @@ class StateManager:
                 logger.warning(f"Workflow {workflow_id} not found")
                 return False
             
-            logger.debug(f"Added step {step_id} to completed steps")
+            logger.debug("Added step %s to completed steps", step_id)
             return True
             
         except Exception as e:
             logger.error(f"Error adding to completed steps: {e}")
             raise
     
+    def complete_step(
+        self,
+        workflow_id: str,
+        step_id: str,
+        updates: Dict[str, Any]
+    ) -> bool:
+        """Update a step's fields and record it as completed in one write.
+        
+        Combines update_step_fields and add_to_completed_steps; both touch
+        the same workflow document, so a single update_one applies them
+        atomically.
+        
+        Args:
+            workflow_id: Workflow identifier
+            step_id: Step identifier
+            updates: Dictionary of step fields to update
+            
+        Returns:
+            True if updated, False if not found
+        """
+        try:
+            set_updates = {
+                f"steps.$.{key}": value
+                for key, value in updates.items()
+            }
+            set_updates["updated_at"] = datetime.now(timezone.utc)
+            
+            result = self.collection.update_one(
+                {
+                    "workflow_id": workflow_id,
+                    "steps.step_id": step_id
+                },
+                {
+                    "$set": set_updates,
+                    "$addToSet": {
+                        "execution_metadata.completed_step_ids": step_id
+                    },
+                    "$inc": {
+                        "execution_metadata.completed_steps": 1
+                    }
+                }
+            )
+            
+            if result.matched_count == 0:
+                logger.warning(
+                    f"Step {step_id} in workflow {workflow_id} not found"
+                )
+                return False
+            
+            logger.debug("Step %s marked completed", step_id)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error completing step {step_id}: {e}")
+            raise
+    
+    def fail_step(
+        self,
+        workflow_id: str,
+        updates: Dict[str, Any],
+        step_id: Optional[str] = None,
+        step_name: Optional[str] = None
+    ) -> bool:
+        """Update a step's fields and count it as failed in one write.
+        
+        The step is matched by step_id when given, otherwise by step_name
+        (for steps that failed before an ID was assigned).
+        
+        Args:
+            workflow_id: Workflow identifier
+            updates: Dictionary of step fields to update
+            step_id: Step identifier
+            step_name: Step name, used when step_id is not available
+            
+        Returns:
+            True if updated, False if not found
+        """
+        step_ref = step_id or step_name
+        try:
+            set_updates = {
+                f"steps.$.{key}": value
+                for key, value in updates.items()
+            }
+            set_updates["updated_at"] = datetime.now(timezone.utc)
+            
+            if step_id:
+                step_filter = {"steps.step_id": step_id}
+            else:
+                step_filter = {"steps.step_name": step_name}
+            
+            result = self.collection.update_one(
+                {"workflow_id": workflow_id, **step_filter},
+                {
+                    "$set": set_updates,
+                    "$inc": {
+                        "execution_metadata.failed_steps": 1
+                    }
+                }
+            )
+            
+            if result.matched_count == 0:
+                logger.warning(
+                    f"Step {step_ref} in workflow {workflow_id} not found"
+                )
+                return False
+            
+            logger.debug("Step %s marked failed", step_ref)
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error failing step {step_ref}: {e}")
+            raise
+    
     def update_workflow_fields(
         self,
         workflow_id: str,
@@ -553,7 +1091,7 @@ class StateManager:
             True if updated successfully
         """
         try:
-            updates["updated_at"] = datetime.utcnow()
+            updates["updated_at"] = datetime.now(timezone.utc)
             
             result = self.collection.update_one(
                 {"workflow_id": workflow_id},
@@ -564,7 +1102,7 @@ class StateManager:
                 logger.warning(f"Workflow {workflow_id} not found")
                 return False
             
-            logger.debug(f"Workflow {workflow_id} fields updated: {updates.keys()}")
+            logger.debug("Workflow %s fields updated: %s", workflow_id, updates.keys())
             return True
             
         except Exception as e:
@@ -592,7 +1130,7 @@ class StateManager:
                 {"workflow_id": workflow_id},
                 {
                     "$inc": {field: value},
-                    "$set": {"updated_at": datetime.utcnow()}
+                    "$set": {"updated_at": datetime.now(timezone.utc)}
                 }
             )
             
@@ -600,13 +1138,97 @@ class StateManager:
                 logger.warning(f"Workflow {workflow_id} not found")
                 return False
             
-            logger.debug(f"Incremented {field} by {value} for workflow {workflow_id}")
+            logger.debug(
+                "Incremented %s by %s for workflow %s",
+                field, value, workflow_id
+            )
             return True
             
         except Exception as e:
             logger.error(f"Error incrementing workflow field: {e}")
             raise
     
+    def watch_pending_workflows(self, resume_token: Optional[Dict[str, Any]] = None):
+        """Open a change stream of workflows entering 'pending'.
+        
+        Matches inserts of pending workflows (direct submission) and updates
+        that set status to 'pending' (planned workflows being submitted).
+        Requires a replica set or sharded cluster.
+        
+        Args:
+            resume_token: Token of the last handled event, to resume after it
+            
+        Returns:
+            pymongo ChangeStream whose events include fullDocument
+            
+        Raises:
+            OperationFailure: If change streams are not supported
+        """
+        pipeline = [
+            {
+                "$match": {
+                    "$or": [
+                        {
+                            "operationType": "insert",
+                            "fullDocument.status": "pending"
+                        },
+                        {
+                            "operationType": "update",
+                            "updateDescription.updatedFields.status": "pending"
+                        }
+                    ]
+                }
+            }
+        ]
+        return self.collection.watch(
+            pipeline,
+            full_document="updateLookup",
+            resume_after=resume_token,
+            max_await_time_ms=1000
+        )
+    
+    def get_resume_token(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a persisted change stream resume token.
+        
+        Args:
+            name: Name of the change stream consumer
+            
+        Returns:
+            Resume token or None if none was saved
+        """
+        state = self.executor_state_collection.find_one({"_id": name})
+        return state.get("resume_token") if state else None
+    
+    def save_resume_token(self, name: str, resume_token: Optional[Dict[str, Any]]) -> None:
+        """Persist a change stream resume token.
+        
+        Args:
+            name: Name of the change stream consumer
+            resume_token: Token of the last handled event
+        """
+        if resume_token is None:
+            return
+        
+        self.executor_state_collection.update_one(
+            {"_id": name},
+            {"$set": {"resume_token": resume_token, "updated_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+    
+    def clear_resume_token(self, name: str) -> None:
+        """Forget a persisted change stream resume token.
+        
+        Args:
+            name: Name of the change stream consumer
+        """
+        self.executor_state_collection.update_one(
+            {"_id": name},
+            {
+                "$unset": {"resume_token": ""},
+                "$set": {"updated_at": datetime.now(timezone.utc)}
+            }
+        )
+    
     def close(self):
         """Close MongoDB connection."""
         if self.client:
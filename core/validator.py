@@ -1,9 +1,14 @@
 """Workflow JSON validation and dependency checking."""
+from collections import OrderedDict
+from copy import deepcopy
 from typing import Dict, List, Set, Any, Optional
+import hashlib
 import re
+import threading
 
 from pydantic import ValidationError
 from models.workflow import WorkflowDefinition, WorkflowStep
+from utils.json_codec import dumps_bytes, json_copy
 from utils.logger import get_logger
 from validators import get_defaults, get_validator
 from utils.output_file_checker import check_and_resolve_output_conflicts
@@ -57,6 +62,125 @@ EXTRA_APP_ALIASES = {
     "hasubtypenumberingconversion": "InfluenzaHASubtypeConversion",
 }
 
+# Canonical AppService IDs; most workflows already use these verbatim.
+_CANONICAL_APP_IDS = frozenset(FRIENDLY_TO_APP_ID.values()) | frozenset(EXTRA_APP_ALIASES.values())
+
+# Pattern to match variable references
+_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Validated workflows keyed by a content hash of the input payload. Only
+# token-less validations are cached: with an auth token the result also
+# depends on workspace state (output conflict checks).
+VALIDATION_CACHE_SIZE = 128
+_validation_cache: "OrderedDict[bytes, WorkflowDefinition]" = OrderedDict()
+_validation_cache_lock = threading.Lock()
+
+
+def _validation_cache_key(workflow_data: Dict[str, Any]) -> Optional[bytes]:
+    """Hash a workflow payload into a validation cache key."""
+    try:
+        payload = dumps_bytes(workflow_data, sort_keys=True)
+    except TypeError:
+        # Not plain JSON (e.g. datetimes); skip caching rather than guess
+        return None
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _copy_payload(workflow_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a payload so validation never normalizes the caller's dict in place.
+
+    Cache hits cannot repeat the in-place normalization a miss would apply,
+    so neither path touches the input; callers use the returned result.
+    """
+    try:
+        return json_copy(workflow_data)
+    except TypeError:
+        return deepcopy(workflow_data)
+
+
+def _get_cached_validation(cache_key: Optional[bytes]) -> Optional[WorkflowDefinition]:
+    """Look up a cached validation result (shared; callers must not mutate it)."""
+    if cache_key is None:
+        return None
+    with _validation_cache_lock:
+        cached = _validation_cache.get(cache_key)
+        if cached is not None:
+            _validation_cache.move_to_end(cache_key)
+    if cached is not None:
+        logger.debug("Using cached validation result")
+    return cached
+
+
+def _cache_validation(cache_key: Optional[bytes], workflow: WorkflowDefinition) -> None:
+    """Store a validation result that no caller holds a reference to."""
+    if cache_key is None:
+        return
+    with _validation_cache_lock:
+        _validation_cache[cache_key] = workflow
+        while len(_validation_cache) > VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+
+
+def _check_str_handler(value: str, context: str, step_names: Set[str]) -> None:
+    """Check a string for valid variable references."""
+    for match in _VAR_PATTERN.findall(value):
+        parts = match.split('.')
+        
+        # Check step references
+        if len(parts) >= 2 and parts[0] == 'steps':
+            step_ref = parts[1]
+            if step_ref not in step_names:
+                raise ValueError(
+                    f"In {context}: Variable reference "
+                    f"'${{{match}}}' refers to unknown step "
+                    f"'{step_ref}'"
+                )
+
+
+def _walk_dict_handler(value: Dict[str, Any], context: str, step_names: Set[str]) -> None:
+    """Check every value of a dict for variable references."""
+    for k, v in value.items():
+        _check_value(v, f"{context}.{k}", step_names)
+
+
+def _walk_list_handler(value: List[Any], context: str, step_names: Set[str]) -> None:
+    """Check every item of a list for variable references."""
+    for i, item in enumerate(value):
+        _check_value(item, f"{context}[{i}]", step_names)
+
+
+def _skip_handler(value: Any, context: str, step_names: Set[str]) -> None:
+    """Scalars cannot contain variable references."""
+
+
+# Exact-type dispatch for JSON-derived values; a single dict lookup
+# instead of an isinstance chain on every node.
+_DISPATCH = {
+    str: _check_str_handler,
+    dict: _walk_dict_handler,
+    list: _walk_list_handler,
+    int: _skip_handler,
+    float: _skip_handler,
+    bool: _skip_handler,
+    type(None): _skip_handler,
+}
+
+
+def _check_value(value: Any, context: str, step_names: Set[str]) -> None:
+    """Recursively check values for variable references."""
+    handler = _DISPATCH.get(type(value))
+    if handler is None:
+        # Subclasses of the JSON container types fall back to isinstance
+        if isinstance(value, str):
+            handler = _check_str_handler
+        elif isinstance(value, dict):
+            handler = _walk_dict_handler
+        elif isinstance(value, list):
+            handler = _walk_list_handler
+        else:
+            return
+    handler(value, context, step_names)
+
 
 class WorkflowValidator:
     """Validates workflow JSON and business logic."""
@@ -74,6 +198,10 @@ class WorkflowValidator:
             return app_name
         app_name = app_name.strip()
 
+        # Fast path: already a canonical AppService ID.
+        if app_name in _CANONICAL_APP_IDS:
+            return app_name
+
         # If it already matches a registered validator/defaults, keep it.
         if get_validator(app_name) or get_defaults(app_name):
             return app_name
@@ -85,9 +213,7 @@ class WorkflowValidator:
             return FRIENDLY_TO_APP_ID[lower_name]
 
         # 2) Case-insensitive exact match against known App IDs.
-        app_ids = set(FRIENDLY_TO_APP_ID.values())
-        app_ids.update(EXTRA_APP_ALIASES.values())
-        for app_id in app_ids:
+        for app_id in _CANONICAL_APP_IDS:
             if lower_name == app_id.lower():
                 return app_id
 
@@ -111,6 +237,40 @@ class WorkflowValidator:
     ) -> WorkflowDefinition:
         """Validate workflow input JSON.
         
+        Without an auth token the result depends only on the payload, so
+        identical payloads (e.g. retried submissions) are served from a
+        small content-addressed cache.
+        
+        Args:
+            workflow_data: Raw workflow dictionary (left unmodified)
+            auth_token: Optional authentication token for workspace API calls
+            
+        Returns:
+            Validated WorkflowDefinition object
+            
+        Raises:
+            ValueError: If validation fails
+        """
+        cache_key = None if auth_token else _validation_cache_key(workflow_data)
+        cached = _get_cached_validation(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        
+        workflow = WorkflowValidator._validate_workflow_input_uncached(
+            _copy_payload(workflow_data),
+            auth_token=auth_token
+        )
+        if cache_key is not None:
+            _cache_validation(cache_key, workflow.model_copy(deep=True))
+        return workflow
+    
+    @staticmethod
+    def _validate_workflow_input_uncached(
+        workflow_data: Dict[str, Any],
+        auth_token: Optional[str] = None
+    ) -> WorkflowDefinition:
+        """Run the full validation pipeline without consulting the cache.
+        
         Args:
             workflow_data: Raw workflow dictionary
             auth_token: Optional authentication token for workspace API calls
@@ -148,13 +308,9 @@ class WorkflowValidator:
                     + "\n  - ".join(service_field_errors)
                 )
             
-            # Validate using Pydantic model
-            logger.info("Validating workflow schema")
-            workflow = WorkflowDefinition(**workflow_data)
-            
             # Apply service-specific defaults and validate steps
-            # This modifies workflow_data and returns updated workflow
-            workflow = WorkflowValidator._apply_step_validators(workflow_data, workflow)
+            # This modifies workflow_data in place and returns it
+            workflow_data = WorkflowValidator._apply_step_validators(workflow_data)
             
             # Check and resolve output file conflicts
             if auth_token:
@@ -163,13 +319,17 @@ class WorkflowValidator:
                     workflow_data,
                     auth_token
                 )
-                # Re-validate with updated workflow_data
-                workflow = WorkflowDefinition(**workflow_data)
             else:
                 logger.info(
                     "No auth token provided - skipping output file conflict check"
                 )
             
+            # Validate using Pydantic model once all mutations are applied.
+            # The schema is compiled into a pydantic-core validator when the
+            # model class is defined; model_validate hands it the dict as-is.
+            logger.info("Validating workflow schema")
+            workflow = WorkflowDefinition.model_validate(workflow_data)
+            
             # Additional business logic validation
             WorkflowValidator.validate_step_dependencies(workflow.steps)
             WorkflowValidator.validate_variable_references(workflow)
@@ -186,6 +346,41 @@ class WorkflowValidator:
             logger.error(f"Validation failed: {e}")
             raise
     
+    @staticmethod
+    def validate_workflow_input_as_dict(
+        workflow_data: Dict[str, Any],
+        auth_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Validate workflow input JSON and return it as a plain dictionary.
+        
+        For callers that only persist or mutate the result: the validated
+        model is dumped once here and not kept alive alongside the dict.
+        Since the model itself never escapes, it is cached (and cache hits
+        dumped) without the defensive deep copies validate_workflow_input
+        makes.
+        
+        Args:
+            workflow_data: Raw workflow dictionary (left unmodified)
+            auth_token: Optional authentication token for workspace API calls
+            
+        Returns:
+            Validated workflow dictionary with schema defaults applied
+            
+        Raises:
+            ValueError: If validation fails
+        """
+        cache_key = None if auth_token else _validation_cache_key(workflow_data)
+        cached = _get_cached_validation(cache_key)
+        if cached is not None:
+            return cached.model_dump()
+        
+        workflow = WorkflowValidator._validate_workflow_input_uncached(
+            _copy_payload(workflow_data),
+            auth_token=auth_token
+        )
+        _cache_validation(cache_key, workflow)
+        return workflow.model_dump()
+    
     @staticmethod
     def validate_step_dependencies(steps: List[WorkflowStep]) -> None:
         """Validate step dependencies.
@@ -284,73 +479,43 @@ class WorkflowValidator:
         
         step_names = {step.step_name for step in workflow.steps}
         
-        # Pattern to match variable references
-        var_pattern = re.compile(r'\$\{([^}]+)\}')
-        
-        def check_string(value: str, context: str) -> None:
-            """Check a string for valid variable references."""
-            matches = var_pattern.findall(value)
-            for match in matches:
-                parts = match.split('.')
-                
-                # Check step references
-                if len(parts) >= 2 and parts[0] == 'steps':
-                    step_ref = parts[1]
-                    if step_ref not in step_names:
-                        raise ValueError(
-                            f"In {context}: Variable reference "
-                            f"'${{{match}}}' refers to unknown step "
-                            f"'{step_ref}'"
-                        )
-        
-        def check_value(value: Any, context: str) -> None:
-            """Recursively check values for variable references."""
-            if isinstance(value, str):
-                check_string(value, context)
-            elif isinstance(value, dict):
-                for k, v in value.items():
-                    check_value(v, f"{context}.{k}")
-            elif isinstance(value, list):
-                for i, item in enumerate(value):
-                    check_value(item, f"{context}[{i}]")
-        
         # Check all steps
         for step in workflow.steps:
             context = f"step '{step.step_name}'"
             
             # Check params
-            check_value(step.params, f"{context}.params")
+            _check_value(step.params, f"{context}.params", step_names)
             
             # Check outputs
             if step.outputs:
-                check_value(step.outputs, f"{context}.outputs")
+                _check_value(step.outputs, f"{context}.outputs", step_names)
         
         # Check workflow outputs
         if workflow.workflow_outputs:
             for i, output in enumerate(workflow.workflow_outputs):
-                check_string(output, f"workflow_outputs[{i}]")
+                _check_str_handler(output, f"workflow_outputs[{i}]", step_names)
         
         logger.debug("Variable references validated")
     
     @staticmethod
     def _apply_step_validators(
-        workflow_data: Dict[str, Any],
-        workflow: WorkflowDefinition
-    ) -> WorkflowDefinition:
+        workflow_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """Apply service-specific defaults and validators to workflow steps.
         
         This method:
         1. Applies default parameters (non-destructive) using defaults providers
         2. Validates step parameters and structure using validators
         3. Updates step params with enriched/validated values
-        4. Returns a new WorkflowDefinition with updated steps
+        
+        Schema validation is left to the caller, which builds the
+        WorkflowDefinition once after all mutations are applied.
         
         Args:
             workflow_data: Raw workflow dictionary (will be modified)
-            workflow: Current WorkflowDefinition object
         
         Returns:
-            New WorkflowDefinition with enriched and validated steps
+            The updated workflow dictionary
         
         Raises:
             ValueError: If validation fails for any step
@@ -360,7 +525,14 @@ class WorkflowValidator:
         validation_errors = []
         validation_warnings = []
         
-        for step_dict in workflow_data['steps']:
+        steps = workflow_data.get('steps')
+        if not isinstance(steps, list):
+            # Leave structural errors to the schema validation pass
+            return workflow_data
+        
+        for step_dict in steps:
+            if not isinstance(step_dict, dict):
+                continue
             step_name = step_dict.get('step_name', 'unknown')
             original_app_name = step_dict.get('app', '')
             app_name = WorkflowValidator._normalize_step_app_name(original_app_name)
@@ -443,10 +615,6 @@ class WorkflowValidator:
                 f"Step validation failed with {len(validation_errors)} error(s):\n{error_summary}"
             )
         
-        # Reconstruct workflow with updated steps
-        # Create new WorkflowDefinition from modified workflow_data
-        validated_workflow = WorkflowDefinition(**workflow_data)
-        
         logger.debug("Service-specific defaults and validators applied successfully")
-        return validated_workflow
+        return workflow_data
 
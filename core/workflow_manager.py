@@ -1,22 +1,72 @@
 """Workflow manager - orchestrates workflow submission and status queries."""
-import json
-from typing import Dict, Any
-from datetime import datetime
+import asyncio
+import copy
+import hashlib
+import multiprocessing
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Any, List, Optional, Tuple, Union
+from datetime import datetime, timezone
 
 from core.validator import WorkflowValidator
-from core.state_manager import StateManager
+from core.state_manager import StateManager, MUTABLE_STATUS_PROJECTION
 from scheduler.client import SchedulerClient
 from models.workflow import WorkflowStatus, StepStatus
+from utils.json_codec import LazyJson, dumps_bytes, json_copy
 from utils.logger import get_logger
 from utils.variable_resolver import VariableResolver
 from utils.workflow_cleaner import clean_empty_optional_lists
+from utils.token_crypto import get_token_cipher
+from utils.ttl_cache import TTLCache
+from utils.ulid import new_ulid
+from utils.workflow_cache import WorkflowCache, TERMINAL_WORKFLOW_STATUSES
 from config.config import config
-from cwl.converter import CWLConverter
-from cwl.parser import CWLParser
+from cwl.converter import convert_cwl_document
 
 
 logger = get_logger(__name__)
 
+# Maximum number of converted CWL workflows kept in memory
+CWL_CONVERSION_CACHE_SIZE = 256
+
+# Maximum number of workflows whose immutable status fields are kept in memory
+STATIC_STATUS_CACHE_SIZE = 10_000
+
+# Shared default for read-only lookups of missing sequences
+_EMPTY_TUPLE: tuple = ()
+
+# Persistence/runtime fields dropped before re-validating a stored workflow.
+# workflow_id is intentionally NOT included - validation allows it.
+_RUNTIME_WORKFLOW_FIELDS = frozenset({
+    "status",
+    "created_at",
+    "updated_at",
+    "submitted_at",
+    "started_at",
+    "completed_at",
+    "error_message",
+    "execution_metadata",
+    "log_file_path",
+    "auth_token",
+    "auth_token_enc",
+    "auth_token_fingerprint",
+})
+_RUNTIME_STEP_FIELDS = frozenset({
+    "step_id",
+    "status",
+    "task_id",
+    "submitted_at",
+    "started_at",
+    "completed_at",
+    "elapsed_time",
+    "error_message",
+})
+
 
 class WorkflowManager:
     """Manages workflow lifecycle: validation, submission, and status tracking."""
@@ -32,9 +82,61 @@ class WorkflowManager:
             timeout=scheduler_config.get('timeout', 30)
         )
 
-        # Initialize CWL converter and parser
-        self.cwl_converter = CWLConverter()
-        self.cwl_parser = CWLParser()
+        # Per-workflow scheduler status backoff: workflow_id -> (next poll at,
+        # attempts, last status). Entries are only created for workflows that
+        # were found, and are bounded and expire once a workflow stops being polled.
+        self._scheduler_poll_base = scheduler_config.get('status_poll_base_seconds', 5)
+        self._scheduler_poll_cap = scheduler_config.get('status_poll_max_seconds', 300)
+        self._scheduler_poll_state = TTLCache(
+            maxsize=scheduler_config.get('status_poll_state_max_entries', 4096),
+            ttl_seconds=scheduler_config.get('status_poll_state_ttl_seconds', 3600)
+        )
+        # The scheduler query is best-effort, so status reads wait for it only
+        # this long (measured from the start of the request)
+        self._scheduler_status_timeout = scheduler_config.get('status_timeout_seconds', 0.2)
+
+        # Worker threads for overlapping independent blocking I/O calls
+        self._io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="wf-io")
+
+        # Bound on concurrent validations in async bulk submission
+        self._max_concurrent_validations = config.api.get('max_concurrent_validations', 8)
+
+        # Per-submission settings read once instead of on every workflow
+        self._max_parallel_steps = config.executor.get('max_parallel_steps_per_workflow', 3)
+        self._workflow_log_dir = config.logging.get('workflow_log_dir', 'logs/workflows')
+
+        redis_config = config.redis
+        self.workflow_cache = WorkflowCache(
+            url=redis_config.get('url'),
+            active_ttl_seconds=redis_config.get('active_ttl_seconds', 30),
+            terminal_ttl_seconds=redis_config.get('terminal_ttl_seconds', 3600)
+        )
+
+        # Short-lived in-process layer in front of Redis/MongoDB for repeated
+        # polls of the same workflow. Keys are ('full' | 'status', workflow_id);
+        # cached documents are shared and must be treated as read-only.
+        self._local_workflow_cache = TTLCache(
+            maxsize=redis_config.get('local_max_entries', 4096),
+            ttl_seconds=redis_config.get('local_ttl_seconds', 2.0)
+        )
+
+        self.token_cipher = get_token_cipher()
+
+        # LRU of status fields that never change once a workflow is submitted
+        # (workflow_name, created_at, per-step step_name/app), keyed by workflow_id
+        self._static_status_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._static_status_lock = threading.Lock()
+
+        # CPU-bound CWL conversions run in worker processes (created lazily);
+        # 0 workers converts in-process instead
+        workers = config.api.get('cwl_conversion_workers')
+        self._cwl_pool_workers = (os.cpu_count() or 1) if workers is None else workers
+        self._cwl_process_pool: Optional[ProcessPoolExecutor] = None
+        self._cwl_pool_lock = threading.Lock()
+
+        # LRU of converted CWL workflows keyed by content hash
+        self._cwl_conversion_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cwl_conversion_lock = threading.Lock()
 
         logger.info("WorkflowManager initialized")
 
@@ -56,79 +158,170 @@ class WorkflowManager:
             Dictionary with workflow_id, status, workflow_name, and step_count
         """
         try:
-            logger.info("Starting workflow registration")
-
-            logger.info(
-                f"Raw workflow JSON received for registration:\n{json.dumps(workflow_json, indent=2)}"
+            start_time = time.perf_counter()
+            logger.debug(
+                "Raw workflow JSON received for registration:\n%s",
+                LazyJson(workflow_json)
             )
 
-            # Step 1: Clean up empty optional lists before processing
-            logger.info("Cleaning up empty optional lists in workflow")
-            cleaned_workflow = clean_empty_optional_lists(workflow_json)
-
-            # Step 2: Resolve variable placeholders
-            logger.info("Resolving variable placeholders for registration")
-            resolved_workflow = VariableResolver.resolve_workflow_variables(cleaned_workflow)
+            workflow_dict = self._prepare_planned_workflow(None, workflow_json, auth_token)
+            workflow_id = workflow_dict['workflow_id']
+            workflow_name = workflow_dict['workflow_name']
+            step_count = len(workflow_dict['steps'])
 
-            # Step 3: Validate workflow
-            logger.info("Validating workflow for registration")
-            validated_workflow = self.validator.validate_workflow_input(
-                resolved_workflow,
-                auth_token=auth_token
-            )
-
-            # Generate workflow_id only if not already present
-            workflow_dict = validated_workflow.model_dump()
-            if 'workflow_id' in resolved_workflow and resolved_workflow['workflow_id']:
-                workflow_id = resolved_workflow['workflow_id']
-                logger.info(f"Using existing workflow_id for registration: {workflow_id}")
-            else:
-                workflow_id = self._generate_workflow_id()
-                logger.info(f"Generated new workflow_id for registration: {workflow_id}")
-            
-            workflow_dict['workflow_id'] = workflow_id
-            workflow_dict['status'] = 'planned'
-            workflow_dict['created_at'] = datetime.utcnow()
-            workflow_dict['updated_at'] = datetime.utcnow()
-
-            # Planned workflows should not have execution state initialized yet.
-            workflow_dict.pop('execution_metadata', None)
-            workflow_dict.pop('log_file_path', None)
-            workflow_dict.pop('started_at', None)
-            workflow_dict.pop('completed_at', None)
-
-            # Store auth token (plaintext for now - TODO: encrypt)
-            if auth_token:
-                workflow_dict['auth_token'] = auth_token
-
-            # Keep steps explicitly planned so UI can render intent before execution.
-            for step in workflow_dict.get('steps', []):
-                if 'status' not in step:
-                    step['status'] = 'planned'
-
-            logger.info(f"Saving registered workflow {workflow_id} to database")
+            logger.debug("Saving registered workflow %s to database", workflow_id)
             self.state_manager.save_workflow(workflow_dict)
+            self._store_auth_token(workflow_id, auth_token)
 
-            step_count = len(workflow_dict.get('steps', []))
+            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
             logger.info(
-                f"Workflow '{validated_workflow.workflow_name}' registered successfully "
-                f"with ID: {workflow_id} (status=planned)"
+                "workflow.registered workflow_id=%s name=%r steps=%d elapsed_ms=%d",
+                workflow_id, workflow_name, step_count, elapsed_ms,
+                extra={
+                    'workflow_id': workflow_id,
+                    'workflow_name': workflow_name,
+                    'step_count': step_count,
+                    'elapsed_ms': elapsed_ms
+                }
             )
 
             return {
                 'workflow_id': workflow_id,
                 'status': 'planned',
-                'workflow_name': validated_workflow.workflow_name,
+                'workflow_name': workflow_name,
                 'step_count': step_count
             }
 
         except ValueError as e:
-            logger.error(f"Workflow registration validation failed: {e}")
+            logger.error("Workflow registration validation failed: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Workflow registration failed: {e}")
+            logger.error("Workflow registration failed: %s", e)
             raise
 
+    def register_workflows_bulk(
+        self,
+        workflow_jsons: List[Dict[str, Any]],
+        auth_token: str = None
+    ) -> List[Dict[str, Any]]:
+        """Register and persist several validated workflows at once.
+
+        Each workflow is cleaned, resolved and validated in-process, then all
+        planned documents are written with a single bulk insert.
+
+        Args:
+            workflow_jsons: List of workflow specification payloads
+            auth_token: Optional authorization token stored with each workflow
+
+        Returns:
+            List of dictionaries with workflow_id, status, workflow_name and
+            step_count, in input order
+
+        Raises:
+            ValueError: If any workflow fails validation or already exists
+                (nothing is persisted)
+            Exception: If registration fails
+        """
+        try:
+            if not isinstance(workflow_jsons, list):
+                raise ValueError("register_workflows_bulk requires a list of JSON objects")
+            logger.info("Starting bulk registration of %s workflows", len(workflow_jsons))
+
+            workflow_docs = [
+                self._prepare_planned_workflow(index, workflow_json, auth_token)
+                for index, workflow_json in enumerate(workflow_jsons)
+            ]
+            summaries = [
+                {
+                    'workflow_id': workflow_doc['workflow_id'],
+                    'status': 'planned',
+                    'workflow_name': workflow_doc['workflow_name'],
+                    'step_count': len(workflow_doc['steps'])
+                }
+                for workflow_doc in workflow_docs
+            ]
+
+            workflow_ids = self.state_manager.save_workflows_bulk(workflow_docs)
+            self._store_auth_tokens_bulk(workflow_ids, auth_token)
+
+            logger.info("Bulk registered %s workflows", len(workflow_ids))
+            return summaries
+
+        except ValueError as e:
+            logger.error("Bulk workflow registration validation failed: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Bulk workflow registration failed: %s", e)
+            raise
+
+    def _prepare_planned_workflow(
+        self,
+        index: Optional[int],
+        workflow_json: Dict[str, Any],
+        auth_token: str = None
+    ) -> Dict[str, Any]:
+        """Clean, resolve and validate one workflow into a planned document.
+
+        Args:
+            index: Position of the workflow in a bulk request (for error
+                messages), or None for a single registration
+            workflow_json: Workflow specification payload
+            auth_token: Optional authorization token used for validation
+
+        Returns:
+            Planned workflow document ready to insert (without the auth token)
+        """
+        if not isinstance(workflow_json, dict):
+            raise ValueError(f"Workflow at index {index} is not a JSON object")
+
+        # Step 1: Clean up empty optional lists before processing
+        logger.debug("Cleaning up empty optional lists in workflow")
+        cleaned_workflow = clean_empty_optional_lists(workflow_json)
+
+        # Step 2: Resolve variable placeholders
+        logger.debug("Resolving variable placeholders for registration")
+        resolved_workflow = VariableResolver.resolve_workflow_variables(cleaned_workflow)
+
+        # Step 3: Validate workflow
+        logger.debug("Validating workflow for registration")
+        try:
+            workflow_dict = self.validator.validate_workflow_input_as_dict(
+                resolved_workflow,
+                auth_token=auth_token
+            )
+        except ValueError as e:
+            if index is None:
+                raise
+            raise ValueError(f"Workflow at index {index}: {e}")
+
+        # Generate workflow_id only if not already present
+        if 'workflow_id' in resolved_workflow and resolved_workflow['workflow_id']:
+            workflow_id = resolved_workflow['workflow_id']
+            logger.debug("Using existing workflow_id for registration: %s", workflow_id)
+        else:
+            workflow_id = self._generate_workflow_id()
+            logger.debug("Generated new workflow_id for registration: %s", workflow_id)
+
+        workflow_dict['workflow_id'] = workflow_id
+        workflow_dict['status'] = 'planned'
+        now = datetime.now(timezone.utc)
+        workflow_dict['created_at'] = now
+        workflow_dict['updated_at'] = now
+
+        # Planned workflows should not have execution state initialized yet.
+        workflow_dict.pop('execution_metadata', None)
+        workflow_dict.pop('log_file_path', None)
+        workflow_dict.pop('started_at', None)
+        workflow_dict.pop('completed_at', None)
+
+        # Keep steps explicitly planned so UI can render intent before execution.
+        # The dumped model always carries a step status (default 'pending'),
+        # so it is assigned rather than defaulted.
+        for step in workflow_dict['steps']:
+            step['status'] = 'planned'
+
+        return workflow_dict
+
     def plan_workflow(self, workflow_json: Dict[str, Any], auth_token: str = None) -> Dict[str, Any]:
         """Persist a workflow plan without validation.
 
@@ -147,11 +340,13 @@ class WorkflowManager:
             workflow_id = self._generate_workflow_id()
             workflow_name = planned_workflow.get("workflow_name") or "Planned Workflow"
 
-            workflow_dict = json.loads(json.dumps(planned_workflow))
+            # The resolver returns a fresh structure, so it can be stored as-is
+            workflow_dict = planned_workflow
             workflow_dict["workflow_id"] = workflow_id
             workflow_dict["status"] = "planned"
-            workflow_dict["created_at"] = datetime.utcnow()
-            workflow_dict["updated_at"] = datetime.utcnow()
+            now = datetime.now(timezone.utc)
+            workflow_dict["created_at"] = now
+            workflow_dict["updated_at"] = now
 
             # Planned workflows should not have execution state initialized yet.
             workflow_dict.pop("execution_metadata", None)
@@ -159,18 +354,16 @@ class WorkflowManager:
             workflow_dict.pop("started_at", None)
             workflow_dict.pop("completed_at", None)
 
-            if auth_token:
-                workflow_dict["auth_token"] = auth_token
-
             steps = workflow_dict.get("steps", [])
             if not isinstance(steps, list):
                 raise ValueError("Workflow plan must contain a 'steps' array")
 
             for step in steps:
-                if isinstance(step, dict) and "status" not in step:
-                    step["status"] = "planned"
+                if isinstance(step, dict):
+                    step.setdefault("status", "planned")
 
             self.state_manager.save_workflow(workflow_dict)
+            self._store_auth_token(workflow_id, auth_token)
             logger.info(
                 "Workflow planned successfully with ID: %s (status=planned, no validation)",
                 workflow_id
@@ -183,14 +376,14 @@ class WorkflowManager:
                 "step_count": len(steps),
             }
         except Exception as e:
-            logger.error(f"Workflow planning failed: {e}")
+            logger.error("Workflow planning failed: %s", e)
             raise
 
     def submit_workflow(self, workflow_json: Dict[str, Any], auth_token: str = None) -> Dict[str, str]:
         """Validate and submit a workflow specification.
 
         This endpoint validates a workflow spec using the same pipeline as the
-        validation endpoint, registers it as planned, then submits it.
+        validation endpoint and persists it directly with status='pending'.
 
         Backward compatibility: if payload only contains workflow_id, submission
         is delegated to submit_planned_workflow().
@@ -207,29 +400,69 @@ class WorkflowManager:
             Exception: If submission fails
         """
         try:
-            logger.info("Starting workflow submission from workflow spec")
+            start_time = time.perf_counter()
             if not isinstance(workflow_json, dict):
                 raise ValueError("submit_workflow requires a JSON object")
 
             workflow_id = workflow_json.get("workflow_id")
             if workflow_id and "steps" not in workflow_json:
-                logger.info(
+                logger.debug(
                     "submit_workflow received workflow_id-only payload; delegating to planned submission"
                 )
                 return self.submit_planned_workflow(workflow_id, auth_token=auth_token)
 
-            registration = self.register_workflow(workflow_json, auth_token=auth_token)
-            return self.submit_planned_workflow(
-                registration["workflow_id"],
-                auth_token=auth_token
+            # Validate once and insert the pending document directly, instead
+            # of inserting a planned document, re-reading and re-validating it,
+            # and then rewriting it as pending.
+            workflow_doc = self._prepare_pending_workflow(None, workflow_json, auth_token)
+            workflow_id = workflow_doc['workflow_id']
+            self.state_manager.save_workflow(
+                workflow_doc,
+                auth_fields=self._protect_auth_token(auth_token)
+            )
+
+            step_count = workflow_doc['execution_metadata']['total_steps']
+            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+            logger.info(
+                "workflow.submitted workflow_id=%s name=%r steps=%d elapsed_ms=%d",
+                workflow_id, workflow_doc['workflow_name'], step_count, elapsed_ms,
+                extra={
+                    'workflow_id': workflow_id,
+                    'workflow_name': workflow_doc['workflow_name'],
+                    'step_count': step_count,
+                    'elapsed_ms': elapsed_ms
+                }
             )
+            return {
+                'workflow_id': workflow_id,
+                'status': 'pending'
+            }
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Workflow submission failed: {e}")
+            logger.error("Workflow submission failed: %s", e)
             raise
 
+    async def submit_workflow_async(
+        self,
+        workflow_json: Dict[str, Any],
+        auth_token: str = None
+    ) -> Dict[str, str]:
+        """Async variant of submit_workflow.
+
+        The blocking validation, workspace and MongoDB calls run in a worker
+        thread so the API event loop keeps serving other requests.
+
+        Args:
+            workflow_json: Workflow specification payload or workflow_id-only payload
+            auth_token: Optional authorization token to update stored token
+
+        Returns:
+            Dictionary with workflow_id and status
+        """
+        return await asyncio.to_thread(self.submit_workflow, workflow_json, auth_token)
+
     def submit_planned_workflow(self, workflow_id: str, auth_token: str = None) -> Dict[str, str]:
         """Validate and promote a persisted planned workflow to pending execution.
 
@@ -241,7 +474,8 @@ class WorkflowManager:
             Dictionary with workflow_id and status
         """
         try:
-            logger.info(f"Submitting planned workflow {workflow_id}")
+            start_time = time.perf_counter()
+            logger.debug("Submitting planned workflow %s", workflow_id)
             workflow = self.state_manager.get_workflow(workflow_id)
             if not workflow:
                 raise ValueError(f"Workflow {workflow_id} not found")
@@ -260,48 +494,34 @@ class WorkflowManager:
                 )
 
             # Validation is intentionally done at submission time for planned workflows.
-            validation_token = auth_token or workflow.get("auth_token")
+            validation_token = auth_token or self._load_auth_token(workflow)
             workflow_for_validation = self._sanitize_workflow_for_validation(workflow)
-            validated_workflow = self.validator.validate_workflow_input(
-                workflow_for_validation,
-                auth_token=validation_token
+            updates = self._build_pending_fields(
+                workflow_id,
+                self.validator.validate_workflow_input_as_dict(
+                    workflow_for_validation,
+                    auth_token=validation_token
+                )
             )
-            validated_workflow_dict = validated_workflow.model_dump()
-
-            steps = validated_workflow_dict.get('steps', [])
-            for step in steps:
-                if isinstance(step, dict):
-                    step['status'] = 'pending'
-
-            from models.workflow import ExecutionMetadata
-            max_parallel = config.executor.get('max_parallel_steps_per_workflow', 3)
-            execution_metadata = ExecutionMetadata(
-                total_steps=len(steps),
-                completed_steps=0,
-                running_steps=0,
-                failed_steps=0,
-                pending_steps=len(steps),
-                currently_running_step_ids=[],
-                completed_step_ids=[],
-                max_parallel_steps=max_parallel
-            ).model_dump()
-
-            log_dir = config.logging.get('workflow_log_dir', 'logs/workflows')
-            updates = dict(validated_workflow_dict)
-            updates.update({
-                'steps': steps,
-                'status': 'pending',
-                'execution_metadata': execution_metadata,
-                'log_file_path': f"{log_dir}/{workflow_id}.log"
-            })
-            if auth_token:
-                updates['auth_token'] = auth_token
+            self._store_auth_token(workflow_id, auth_token)
 
+            # Only write fields that differ from the stored planned document
+            updates = {
+                field: value
+                for field, value in updates.items()
+                if workflow.get(field) != value
+            }
             updated = self.state_manager.update_workflow_fields(workflow_id, updates)
+            self._invalidate_workflow(workflow_id)
             if not updated:
                 raise ValueError(f"Workflow {workflow_id} not found")
 
-            logger.info(f"Planned workflow {workflow_id} promoted to pending")
+            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+            logger.info(
+                "workflow.submitted workflow_id=%s elapsed_ms=%d",
+                workflow_id, elapsed_ms,
+                extra={'workflow_id': workflow_id, 'elapsed_ms': elapsed_ms}
+            )
             return {
                 'workflow_id': workflow_id,
                 'status': 'pending'
@@ -309,9 +529,240 @@ class WorkflowManager:
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Failed to submit planned workflow {workflow_id}: {e}")
+            logger.error("Failed to submit planned workflow %s: %s", workflow_id, e)
             raise
 
+    def submit_workflows_bulk(
+        self,
+        workflow_jsons: List[Dict[str, Any]],
+        auth_token: str = None
+    ) -> List[Dict[str, str]]:
+        """Validate and submit several workflow specifications at once.
+
+        Each workflow is cleaned, resolved and validated in-process, then all
+        pending documents are written with a single bulk insert instead of one
+        register + update round-trip pair per workflow.
+
+        Args:
+            workflow_jsons: List of workflow specification payloads
+            auth_token: Optional authorization token stored with each workflow
+
+        Returns:
+            List of dictionaries with workflow_id and status, in input order
+
+        Raises:
+            ValueError: If any workflow fails validation or already exists
+                (nothing is persisted)
+            Exception: If submission fails
+        """
+        try:
+            if not isinstance(workflow_jsons, list):
+                raise ValueError("submit_workflows_bulk requires a list of JSON objects")
+            logger.info("Starting bulk submission of %s workflows", len(workflow_jsons))
+
+            workflow_docs = [
+                self._prepare_pending_workflow(index, workflow_json, auth_token)
+                for index, workflow_json in enumerate(workflow_jsons)
+            ]
+
+            workflow_ids = self.state_manager.save_workflows_bulk(
+                workflow_docs,
+                auth_fields=self._protect_auth_token(auth_token)
+            )
+
+            logger.info("Bulk submitted %s workflows", len(workflow_ids))
+            return [
+                {'workflow_id': workflow_id, 'status': 'pending'}
+                for workflow_id in workflow_ids
+            ]
+
+        except ValueError as e:
+            logger.error("Bulk workflow submission validation failed: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Bulk workflow submission failed: %s", e)
+            raise
+
+    async def submit_workflows_bulk_async(
+        self,
+        workflow_jsons: List[Dict[str, Any]],
+        auth_token: str = None
+    ) -> List[Dict[str, str]]:
+        """Async variant of submit_workflows_bulk.
+
+        Validation (which may call the workspace API for output conflict
+        checks) runs in worker threads with bounded concurrency, followed by
+        a single bulk insert.
+
+        Args:
+            workflow_jsons: List of workflow specification payloads
+            auth_token: Optional authorization token stored with each workflow
+
+        Returns:
+            List of dictionaries with workflow_id and status, in input order
+        """
+        if not isinstance(workflow_jsons, list):
+            raise ValueError("submit_workflows_bulk requires a list of JSON objects")
+
+        logger.info("Starting async bulk submission of %s workflows", len(workflow_jsons))
+        semaphore = asyncio.Semaphore(self._max_concurrent_validations)
+
+        async def prepare(index: int, workflow_json: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._prepare_pending_workflow, index, workflow_json, auth_token
+                )
+
+        workflow_docs = await asyncio.gather(
+            *(prepare(index, workflow_json) for index, workflow_json in enumerate(workflow_jsons))
+        )
+        workflow_ids = await asyncio.to_thread(
+            self.state_manager.save_workflows_bulk,
+            list(workflow_docs),
+            self._protect_auth_token(auth_token)
+        )
+
+        logger.info("Bulk submitted %s workflows", len(workflow_ids))
+        return [
+            {'workflow_id': workflow_id, 'status': 'pending'}
+            for workflow_id in workflow_ids
+        ]
+
+    def _prepare_pending_workflow(
+        self,
+        index: Optional[int],
+        workflow_json: Dict[str, Any],
+        auth_token: str = None
+    ) -> Dict[str, Any]:
+        """Clean, resolve and validate one workflow into a pending document.
+
+        Args:
+            index: Position of the workflow in a bulk request (for error
+                messages), or None for a single submission
+            workflow_json: Workflow specification payload
+            auth_token: Optional authorization token used for validation
+
+        Returns:
+            Pending workflow document ready to insert (without the auth token)
+        """
+        if not isinstance(workflow_json, dict):
+            raise ValueError(f"Workflow at index {index} is not a JSON object")
+
+        cleaned_workflow = clean_empty_optional_lists(workflow_json)
+        resolved_workflow = VariableResolver.resolve_workflow_variables(cleaned_workflow)
+        try:
+            validated_dict = self.validator.validate_workflow_input_as_dict(
+                resolved_workflow,
+                auth_token=auth_token
+            )
+        except ValueError as e:
+            if index is None:
+                raise
+            raise ValueError(f"Workflow at index {index}: {e}")
+
+        workflow_id = resolved_workflow.get('workflow_id') or self._generate_workflow_id()
+        workflow_doc = self._build_pending_fields(workflow_id, validated_dict)
+        workflow_doc['workflow_id'] = workflow_id
+        now = datetime.now(timezone.utc)
+        workflow_doc['created_at'] = now
+        workflow_doc['updated_at'] = now
+        return workflow_doc
+
+    def _store_auth_token(self, workflow_id: str, auth_token: Optional[str]) -> None:
+        """Persist a workflow's auth token in the auth collection.
+
+        Args:
+            workflow_id: Workflow identifier
+            auth_token: Raw auth token (nothing is stored when empty)
+        """
+        if auth_token:
+            self.state_manager.save_workflow_auth(
+                workflow_id,
+                self.token_cipher.protect(auth_token)
+            )
+
+    def _protect_auth_token(self, auth_token: Optional[str]) -> Optional[Dict[str, str]]:
+        """Build the auth fields stored alongside a newly inserted workflow.
+
+        Args:
+            auth_token: Raw auth token
+
+        Returns:
+            Token fields from AuthTokenCipher.protect(), or None when empty
+        """
+        if not auth_token:
+            return None
+        return self.token_cipher.protect(auth_token)
+
+    def _store_auth_tokens_bulk(self, workflow_ids: List[str], auth_token: Optional[str]) -> None:
+        """Persist one auth token for several workflows in a single write.
+
+        Args:
+            workflow_ids: Workflow identifiers
+            auth_token: Raw auth token (nothing is stored when empty)
+        """
+        if auth_token:
+            auth_fields = self.token_cipher.protect(auth_token)
+            self.state_manager.save_workflow_auths_bulk(
+                {workflow_id: auth_fields for workflow_id in workflow_ids}
+            )
+
+    def _load_auth_token(self, workflow: Dict[str, Any]) -> Optional[str]:
+        """Recover a workflow's raw auth token.
+
+        Falls back to token fields embedded in the workflow document, which is
+        where workflows stored before the auth collection existed keep them.
+
+        Args:
+            workflow: Workflow document
+
+        Returns:
+            Raw auth token or None
+        """
+        auth_doc = self.state_manager.get_workflow_auth(workflow.get('workflow_id'))
+        return self.token_cipher.reveal(auth_doc or workflow)
+
+    def _build_pending_fields(
+        self,
+        workflow_id: str,
+        validated_workflow_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the fields that promote a validated workflow to pending.
+
+        Args:
+            workflow_id: Workflow identifier
+            validated_workflow_dict: Dumped WorkflowDefinition (updated in place)
+
+        Returns:
+            Workflow fields with pending steps and fresh execution metadata
+        """
+        # Steps come from a dumped WorkflowDefinition, so every entry is a dict
+        steps = validated_workflow_dict['steps']
+        for step in steps:
+            step['status'] = 'pending'
+
+        # Plain dict with the ExecutionMetadata shape; every value is built
+        # here, so a Pydantic validation pass would only add overhead.
+        n_steps = len(steps)
+        execution_metadata = {
+            'total_steps': n_steps,
+            'completed_steps': 0,
+            'running_steps': 0,
+            'failed_steps': 0,
+            'pending_steps': n_steps,
+            'currently_running_step_ids': [],
+            'completed_step_ids': [],
+            'max_parallel_steps': self._max_parallel_steps
+        }
+
+        validated_workflow_dict.update({
+            'steps': steps,
+            'status': 'pending',
+            'execution_metadata': execution_metadata,
+            'log_file_path': f"{self._workflow_log_dir}/{workflow_id}.log"
+        })
+        return validated_workflow_dict
+
     @staticmethod
     def _sanitize_workflow_for_validation(workflow: Dict[str, Any]) -> Dict[str, Any]:
         """Remove persistence/runtime fields before validator input checks.
@@ -319,40 +770,26 @@ class WorkflowManager:
         Note: workflow_id is now preserved to support validation of workflows
         that already have an assigned ID.
         """
-        payload = json.loads(json.dumps(workflow or {}))
-
-        # workflow_id is intentionally NOT removed - validation now allows it
-        for top_level_field in (
-            "status",
-            "created_at",
-            "updated_at",
-            "submitted_at",
-            "started_at",
-            "completed_at",
-            "error_message",
-            "execution_metadata",
-            "log_file_path",
-            "auth_token",
-        ):
-            payload.pop(top_level_field, None)
+        # Strip runtime fields (including the stored datetimes) before the
+        # deep copy, so only JSON-compatible spec data is serialized
+        payload = {
+            key: value
+            for key, value in (workflow or {}).items()
+            if key not in _RUNTIME_WORKFLOW_FIELDS
+        }
 
         if isinstance(payload.get("steps"), list):
-            for step in payload["steps"]:
-                if not isinstance(step, dict):
-                    continue
-                for step_field in (
-                    "step_id",
-                    "status",
-                    "task_id",
-                    "submitted_at",
-                    "started_at",
-                    "completed_at",
-                    "elapsed_time",
-                    "error_message",
-                ):
-                    step.pop(step_field, None)
-
-        return payload
+            payload["steps"] = [
+                {
+                    key: value
+                    for key, value in step.items()
+                    if key not in _RUNTIME_STEP_FIELDS
+                }
+                if isinstance(step, dict) else step
+                for step in payload["steps"]
+            ]
+
+        return json_copy(payload)
 
     def validate_workflow(self, workflow_json: Dict[str, Any], auth_token: str = None) -> Dict[str, Any]:
         """Validate a workflow without submission side effects.
@@ -381,8 +818,9 @@ class WorkflowManager:
         try:
             logger.info("Starting workflow validation (no submission)")
 
-            # Keep immutable copies for reporting.
-            original_workflow = json.loads(json.dumps(workflow_json))
+            # Cleaning and resolution both work on copies, so the caller's
+            # payload stays untouched and can be compared against directly.
+            original_workflow = workflow_json
 
             # Step 1: Clean up empty optional lists before processing
             logger.info("Cleaning up empty optional lists in workflow")
@@ -394,11 +832,10 @@ class WorkflowManager:
 
             # Step 2: Validate workflow and apply service-level normalization/defaults.
             logger.info("Validating workflow")
-            validated_workflow = self.validator.validate_workflow_input(
+            validated_dict = self.validator.validate_workflow_input_as_dict(
                 resolved_workflow,
                 auth_token=auth_token
             )
-            validated_dict = validated_workflow.model_dump()
 
             # Surface coarse-grained auto-fix metadata so callers can explain
             # what changed during compile/validation.
@@ -417,28 +854,32 @@ class WorkflowManager:
             }
 
         except ValueError as e:
-            logger.error(f"Workflow validation failed: {e}")
+            logger.error("Workflow validation failed: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Workflow validation pipeline failed: {e}")
+            logger.error("Workflow validation pipeline failed: %s", e)
             raise
 
     @staticmethod
     def _generate_workflow_id() -> str:
         """Generate workflow ID locally.
 
+        IDs embed a monotonic ULID, so they sort by creation time and the
+        workflow_id index doubles as a time-ordered index.
+
         Returns:
             Workflow ID string
         """
-        import time
-        import random
-        timestamp = int(time.time() * 1000)
-        random_part = random.randint(1000, 9999)
-        return f"wf_{timestamp}_{random_part}"
+        return f"wf_{new_ulid()}"
 
     def get_workflow_status(self, workflow_id: str) -> WorkflowStatus:
         """Get status of a workflow.
 
+        When the scheduler is due for a poll, that query runs on a worker
+        thread while the database read proceeds. It is best-effort and only
+        waited on within the status timeout budget, so latency is bounded
+        by max(db, budget).
+
         Args:
             workflow_id: Workflow identifier
 
@@ -449,63 +890,234 @@ class WorkflowManager:
             ValueError: If workflow not found
         """
         try:
-            logger.info(f"Retrieving status for workflow {workflow_id}")
+            logger.info("Retrieving status for workflow %s", workflow_id)
+            deadline = time.monotonic() + self._scheduler_status_timeout
+
+            # Optionally query scheduler for real-time status, overlapping it
+            # with the database read (currently scheduler returns mock data)
+            poll_state = self._scheduler_poll_state.get(workflow_id)
+            last_status = poll_state[2] if poll_state else None
+            scheduler_future = None
+            if self._should_poll_scheduler(workflow_id, poll_state):
+                scheduler_future = self._io_executor.submit(
+                    self.scheduler_client.get_scheduler_status,
+                    workflow_id
+                )
 
-            # Retrieve from database
-            workflow = self.state_manager.get_workflow(workflow_id)
+            # Retrieve from cache or database
+            workflow = self._get_workflow_status_document(workflow_id)
+
+            if scheduler_future is not None:
+                try:
+                    scheduler_status = scheduler_future.result(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                    logger.debug(
+                        "Scheduler status: %s",
+                        scheduler_status.get('scheduler_status')
+                    )
+                except FutureTimeoutError:
+                    logger.debug(
+                        "Scheduler status for %s not ready within %ss - using database status",
+                        workflow_id, self._scheduler_status_timeout
+                    )
+                except Exception as e:
+                    logger.warning("Failed to get scheduler status: %s", e)
+                    # Continue with database status
 
             if not workflow:
-                logger.error(f"Workflow {workflow_id} not found")
+                logger.error("Workflow %s not found", workflow_id)
                 raise ValueError(f"Workflow {workflow_id} not found")
 
-            # Optionally query scheduler for real-time status
-            # (Currently scheduler returns mock data)
-            try:
-                scheduler_status = self.scheduler_client.get_scheduler_status(
+            self._record_polled_status(workflow_id, last_status, workflow.get('status'))
+
+            status = self._build_workflow_status(workflow)
+
+            logger.info("Workflow %s status: %s", workflow_id, status.status)
+
+            return status
+
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Error retrieving workflow status: %s", e)
+            raise
+
+    async def get_workflow_status_async(self, workflow_id: str) -> WorkflowStatus:
+        """Async variant of get_workflow_status.
+
+        The MongoDB read and the scheduler status query run concurrently in
+        worker threads. The scheduler query is only waited on until the
+        status timeout budget runs out, so latency is bounded by
+        max(db, budget). The backoff decision uses the last status seen for
+        this workflow.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            WorkflowStatus object
+
+        Raises:
+            ValueError: If workflow not found
+        """
+        try:
+            logger.info("Retrieving status for workflow %s", workflow_id)
+
+            deadline = time.monotonic() + self._scheduler_status_timeout
+            poll_state = self._scheduler_poll_state.get(workflow_id)
+            last_status = poll_state[2] if poll_state else None
+
+            scheduler_task = None
+            if self._should_poll_scheduler(workflow_id, poll_state):
+                scheduler_task = asyncio.ensure_future(asyncio.to_thread(
+                    self.scheduler_client.get_scheduler_status,
                     workflow_id
-                )
-                logger.debug(
-                    f"Scheduler status: {scheduler_status.get('scheduler_status')}"
-                )
-            except Exception as e:
-                logger.warning(f"Failed to get scheduler status: {e}")
-                # Continue with database status
-
-            # Build step status list
-            steps = []
-            for step in workflow.get('steps', []):
-                # Pending workflows may not have scheduler-assigned step_id/task_id yet.
-                # StepStatus requires a string, so coerce null/empty values safely.
-                step_id_value = step.get('step_id') or step.get('task_id') or ''
-                steps.append(StepStatus(
-                    step_id=step_id_value,
-                    step_name=step.get('step_name', ''),
-                    status=step.get('status', 'unknown'),
-                    app=step.get('app', '')
                 ))
 
-            # Create status response
-            status = WorkflowStatus(
-                workflow_id=workflow['workflow_id'],
-                workflow_name=workflow['workflow_name'],
-                status=workflow.get('status', 'unknown'),
-                created_at=workflow.get('created_at', datetime.utcnow()),
-                updated_at=workflow.get('updated_at', datetime.utcnow()),
-                steps=steps
-            )
+            try:
+                workflow = await asyncio.to_thread(self._get_workflow_status_document, workflow_id)
+            except BaseException:
+                if scheduler_task is not None:
+                    scheduler_task.cancel()
+                raise
+
+            if scheduler_task is not None:
+                try:
+                    scheduler_status = await asyncio.wait_for(
+                        scheduler_task,
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                    logger.debug(
+                        "Scheduler status: %s",
+                        scheduler_status.get('scheduler_status')
+                    )
+                except asyncio.TimeoutError:
+                    logger.debug(
+                        "Scheduler status for %s not ready within %ss - using database status",
+                        workflow_id, self._scheduler_status_timeout
+                    )
+                except Exception as e:
+                    logger.warning("Failed to get scheduler status: %s", e)
 
-            logger.info(
-                f"Workflow {workflow_id} status: {status.status}"
-            )
+            if not workflow:
+                logger.error("Workflow %s not found", workflow_id)
+                raise ValueError(f"Workflow {workflow_id} not found")
+
+            self._record_polled_status(workflow_id, last_status, workflow.get('status'))
+
+            status = self._build_workflow_status(workflow)
+
+            logger.info("Workflow %s status: %s", workflow_id, status.status)
 
             return status
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Error retrieving workflow status: {e}")
+            logger.error("Error retrieving workflow status: %s", e)
             raise
 
+    @staticmethod
+    def _build_workflow_status(workflow: Dict[str, Any]) -> WorkflowStatus:
+        """Build a WorkflowStatus response from a workflow document.
+
+        Uses model_construct to skip Pydantic validation: every value comes
+        from a stored document that was validated on submission.
+
+        Args:
+            workflow: Workflow document
+
+        Returns:
+            WorkflowStatus object
+        """
+        # Build step status list. Pending workflows may not have
+        # scheduler-assigned step_id/task_id yet; StepStatus requires a
+        # string, so coerce null/empty values safely. The constructor is
+        # bound once outside the per-step loop.
+        construct_step = StepStatus.model_construct
+        steps = [
+            construct_step(
+                step_id=step.get('step_id') or step.get('task_id') or '',
+                step_name=step.get('step_name', ''),
+                status=step.get('status', 'unknown'),
+                app=step.get('app', '')
+            )
+            for step in workflow.get('steps', _EMPTY_TUPLE)
+        ]
+
+        # Timestamps are always stored; only fall back to "now" when missing
+        created_at = workflow.get('created_at')
+        updated_at = workflow.get('updated_at')
+        if created_at is None or updated_at is None:
+            now = datetime.now(timezone.utc)
+            created_at = created_at or now
+            updated_at = updated_at or now
+
+        # Create status response
+        return WorkflowStatus.model_construct(
+            workflow_id=workflow['workflow_id'],
+            workflow_name=workflow['workflow_name'],
+            status=workflow.get('status', 'unknown'),
+            created_at=created_at,
+            updated_at=updated_at,
+            steps=steps
+        )
+
+    def _should_poll_scheduler(
+        self,
+        workflow_id: str,
+        poll_state: Optional[Tuple[float, int, str]]
+    ) -> bool:
+        """Decide whether a status request should also query the scheduler.
+
+        Only workflows whose document was already found are polled, so
+        requests for unknown IDs neither query the scheduler nor leave
+        backoff state behind; the first successful read records the
+        workflow and later requests may poll. Terminal workflows are never
+        recorded. Polls are spaced with jittered exponential backoff that
+        resets whenever the stored status changes (see _record_polled_status),
+        so repeated status requests do not hammer the scheduler.
+
+        Args:
+            workflow_id: Workflow identifier
+            poll_state: Backoff state recorded for the workflow, if any
+
+        Returns:
+            True if the scheduler should be queried now
+        """
+        if poll_state is None:
+            return False
+
+        now = time.monotonic()
+        next_poll_at, attempts, status = poll_state
+        if now < next_poll_at:
+            return False
+
+        delay = min(self._scheduler_poll_cap, self._scheduler_poll_base * 2 ** attempts)
+        delay *= random.uniform(0.5, 1.5)
+        self._scheduler_poll_state.set(workflow_id, (now + delay, attempts + 1, status))
+        return True
+
+    def _record_polled_status(
+        self,
+        workflow_id: str,
+        last_status: Optional[str],
+        current_status: Optional[str]
+    ) -> None:
+        """Record the status of a found workflow for the next backoff decision.
+
+        Args:
+            workflow_id: Workflow identifier
+            last_status: Status the backoff decision was based on (None if
+                the workflow had no backoff state)
+            current_status: Status just read for the workflow
+        """
+        if current_status in TERMINAL_WORKFLOW_STATUSES:
+            self._scheduler_poll_state.pop(workflow_id)
+        elif last_status is None or current_status != last_status:
+            self._scheduler_poll_state.set(workflow_id, (0.0, 0, current_status))
+
     def get_full_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """Get complete workflow document.
 
@@ -518,41 +1130,230 @@ class WorkflowManager:
         Raises:
             ValueError: If workflow not found
         """
-        logger.info(f"Retrieving full workflow {workflow_id}")
+        logger.info("Retrieving full workflow %s", workflow_id)
 
-        workflow = self.state_manager.get_workflow(workflow_id)
+        workflow = self._get_workflow_document(workflow_id)
 
         if not workflow:
-            logger.error(f"Workflow {workflow_id} not found")
+            logger.error("Workflow %s not found", workflow_id)
             raise ValueError(f"Workflow {workflow_id} not found")
 
         return workflow
 
+    def get_workflows_bulk(self, workflow_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several workflow documents, serving cache hits with one MGET.
+
+        As in _get_workflow_document, only terminal workflows are served
+        from or stored in the cache.
+
+        Args:
+            workflow_ids: Workflow identifiers
+
+        Returns:
+            Workflow documents in input order (unknown IDs are omitted)
+        """
+        workflows = {
+            workflow_id: workflow
+            for workflow_id, workflow in self.workflow_cache.get_many(workflow_ids).items()
+            if workflow.get('status') in TERMINAL_WORKFLOW_STATUSES
+        }
+
+        missing_ids = [wid for wid in workflow_ids if wid not in workflows]
+        if missing_ids:
+            for workflow in self.state_manager.get_workflows_by_ids(missing_ids):
+                if workflow.get('status') in TERMINAL_WORKFLOW_STATUSES:
+                    self.workflow_cache.set(workflow)
+                workflows[workflow['workflow_id']] = workflow
+
+        return [workflows[wid] for wid in workflow_ids if wid in workflows]
+
+    def _get_workflow_status_document(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Look up the fields needed for a status response.
+
+        Cached full documents are only used for terminal workflows: the
+        executor process updates step and workflow state without
+        invalidating this process's or Redis' copies, so active workflows
+        read their status fields from MongoDB (behind the short-lived
+        in-process status cache).
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            Workflow document (possibly projected) or None if not found
+        """
+        workflow = self._local_workflow_cache.get(('full', workflow_id))
+        if workflow is not None and workflow.get('status') in TERMINAL_WORKFLOW_STATUSES:
+            return workflow
+
+        workflow = self._local_workflow_cache.get(('status', workflow_id))
+        if workflow is not None:
+            return workflow
+
+        workflow = self.workflow_cache.get(workflow_id)
+        if workflow is not None and workflow.get('status') in TERMINAL_WORKFLOW_STATUSES:
+            logger.debug("Workflow cache hit for %s", workflow_id)
+            self._local_workflow_cache.set(('full', workflow_id), workflow)
+            return workflow
+
+        workflow = self._read_workflow_status_fields(workflow_id)
+        if workflow:
+            self._local_workflow_cache.set(('status', workflow_id), workflow)
+        return workflow
+
+    def _read_workflow_status_fields(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Read status fields from MongoDB, using cached immutable fields when known.
+
+        If the immutable fields of this workflow are cached in-process, only
+        the mutable status fields are read and merged in; on a miss the full
+        status projection is read and its immutable part remembered.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            Projected workflow document or None if not found
+        """
+        with self._static_status_lock:
+            static_fields = self._static_status_cache.get(workflow_id)
+            if static_fields is not None:
+                self._static_status_cache.move_to_end(workflow_id)
+
+        if static_fields is not None:
+            mutable_fields = self.state_manager.get_workflow_status_fields(
+                workflow_id,
+                MUTABLE_STATUS_PROJECTION
+            )
+            if mutable_fields is None:
+                self._forget_static_status(workflow_id)
+                return None
+
+            mutable_steps = mutable_fields.get('steps', _EMPTY_TUPLE)
+            if len(mutable_steps) == len(static_fields['steps']):
+                mutable_fields['workflow_name'] = static_fields['workflow_name']
+                mutable_fields['created_at'] = static_fields['created_at']
+                mutable_fields['steps'] = [
+                    {**step, 'step_name': step_name, 'app': app}
+                    for step, (step_name, app) in zip(mutable_steps, static_fields['steps'])
+                ]
+                return mutable_fields
+
+            # Step layout changed underneath us; re-read everything below
+            self._forget_static_status(workflow_id)
+
+        workflow = self.state_manager.get_workflow_status_fields(workflow_id)
+        if workflow and workflow.get('status') != 'planned':
+            # Planned workflows are rewritten on submission, so only cache after
+            self._remember_static_status(workflow)
+        return workflow
+
+    def _remember_static_status(self, workflow: Dict[str, Any]) -> None:
+        """Cache the immutable status fields of a workflow.
+
+        Args:
+            workflow: Workflow document with the STATUS_PROJECTION fields
+        """
+        static_fields = {
+            'workflow_name': workflow.get('workflow_name'),
+            'created_at': workflow.get('created_at'),
+            'steps': [
+                (step.get('step_name', ''), step.get('app', ''))
+                for step in workflow.get('steps', _EMPTY_TUPLE)
+            ]
+        }
+        with self._static_status_lock:
+            self._static_status_cache[workflow['workflow_id']] = static_fields
+            self._static_status_cache.move_to_end(workflow['workflow_id'])
+            while len(self._static_status_cache) > STATIC_STATUS_CACHE_SIZE:
+                self._static_status_cache.popitem(last=False)
+
+    def _forget_static_status(self, workflow_id: str) -> None:
+        """Drop cached immutable status fields for a workflow.
+
+        Args:
+            workflow_id: Workflow identifier
+        """
+        with self._static_status_lock:
+            self._static_status_cache.pop(workflow_id, None)
+
+    def _get_workflow_document(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Read-through lookup of a workflow document.
+
+        Only terminal workflows are served from or stored in the caches: the
+        executor process updates active workflows without invalidating any
+        cached copy, so those are always read from MongoDB.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            Workflow document owned by the caller, or None if not found
+        """
+        workflow = self._local_workflow_cache.get(('full', workflow_id))
+        if workflow is not None and workflow.get('status') in TERMINAL_WORKFLOW_STATUSES:
+            return copy.deepcopy(workflow)
+
+        workflow = self.workflow_cache.get(workflow_id)
+        if workflow is not None and workflow.get('status') in TERMINAL_WORKFLOW_STATUSES:
+            logger.debug("Workflow cache hit for %s", workflow_id)
+        else:
+            workflow = self.state_manager.get_workflow(workflow_id)
+            if not workflow or workflow.get('status') not in TERMINAL_WORKFLOW_STATUSES:
+                return workflow
+            self.workflow_cache.set(workflow)
+
+        # The in-process layer is shared, so it keeps its own copy
+        self._local_workflow_cache.set(('full', workflow_id), copy.deepcopy(workflow))
+        return workflow
+
+    def _invalidate_workflow(self, workflow_id: str) -> None:
+        """Drop cached copies of a workflow after this process changed it.
+
+        Args:
+            workflow_id: Workflow identifier
+        """
+        self._local_workflow_cache.pop(('full', workflow_id))
+        self._local_workflow_cache.pop(('status', workflow_id))
+        self.workflow_cache.invalidate(workflow_id)
+
     def update_workflow_status(
         self,
         workflow_id: str,
-        status: str
+        status: str,
+        allowed_current_statuses: Optional[List[str]] = None
     ) -> bool:
         """Update workflow status.
 
         Args:
             workflow_id: Workflow identifier
             status: New status value
+            allowed_current_statuses: Only update if the current status is one
+                of these (None allows any transition)
 
         Returns:
-            True if updated successfully
+            True if updated, False if the current status is not allowed
+
+        Raises:
+            ValueError: If workflow not found
         """
-        logger.info(f"Updating workflow {workflow_id} status to {status}")
+        logger.info("Updating workflow %s status to %s", workflow_id, status)
 
         result = self.state_manager.update_workflow_status(
             workflow_id,
-            status
+            status,
+            allowed_current_statuses=allowed_current_statuses
         )
-
-        if not result:
+        self._invalidate_workflow(workflow_id)
+
+        if result is None:
+            if (
+                allowed_current_statuses is not None
+                and self.state_manager.get_workflow_status_fields(workflow_id)
+            ):
+                return False
             raise ValueError(f"Workflow {workflow_id} not found")
 
-        return result
+        return True
 
     def convert_cwl_workflow(self, cwl_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert CWL workflow to custom format.
@@ -572,32 +1373,90 @@ class WorkflowManager:
         try:
             logger.info("Converting CWL workflow to custom format")
 
-            # Parse and validate CWL
-            cwl_workflow = self.cwl_parser.parse_cwl(cwl_data)
-            self.cwl_parser.validate_cwl_workflow(cwl_workflow)
+            # Identical CWL documents (e.g. parameterized reruns) reuse the
+            # previous conversion instead of parsing/validating/converting again.
+            cache_key = self._cwl_cache_key(cwl_data)
+            with self._cwl_conversion_lock:
+                cached = self._cwl_conversion_cache.get(cache_key)
+                if cached is not None:
+                    self._cwl_conversion_cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.info("Using cached CWL workflow conversion")
+                return copy.deepcopy(cached)
+
+            # Parse, validate and convert outside the GIL of this process
+            cwl_pool = self._get_cwl_process_pool()
+            if cwl_pool is not None:
+                custom_workflow = cwl_pool.submit(convert_cwl_document, cwl_data).result()
+            else:
+                custom_workflow = convert_cwl_document(cwl_data)
 
-            # Convert to custom format
-            custom_workflow = self.cwl_converter.convert(cwl_workflow)
+            with self._cwl_conversion_lock:
+                self._cwl_conversion_cache[cache_key] = copy.deepcopy(custom_workflow)
+                while len(self._cwl_conversion_cache) > CWL_CONVERSION_CACHE_SIZE:
+                    self._cwl_conversion_cache.popitem(last=False)
 
             logger.info("CWL workflow conversion completed successfully")
             return custom_workflow
 
         except Exception as e:
-            logger.error(f"CWL conversion failed: {e}")
+            logger.error("CWL conversion failed: %s", e)
             raise ValueError(f"Failed to convert CWL workflow: {e}")
 
-    def submit_cwl_workflow(self, cwl_data: Dict[str, Any], auth_token: str = None) -> Dict[str, str]:
+    def _get_cwl_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Get the CWL conversion process pool, creating it on first use.
+
+        Workers are spawned rather than forked: this process holds MongoDB
+        and HTTP connection pools plus their background threads, which are
+        not fork-safe.
+
+        Returns:
+            Process pool, or None if conversion should run in-process
+        """
+        if self._cwl_pool_workers <= 0:
+            return None
+
+        with self._cwl_pool_lock:
+            if self._cwl_process_pool is None:
+                self._cwl_process_pool = ProcessPoolExecutor(
+                    max_workers=self._cwl_pool_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._cwl_process_pool
+
+    @staticmethod
+    def _cwl_cache_key(cwl_data: Any) -> str:
+        """Hash CWL input content into a conversion cache key.
+
+        Args:
+            cwl_data: CWL workflow dictionary or raw YAML/JSON text
+
+        Returns:
+            Hex digest identifying the CWL content
+        """
+        if isinstance(cwl_data, str):
+            payload = cwl_data.encode('utf-8')
+        else:
+            payload = dumps_bytes(cwl_data, default=str, sort_keys=True)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def submit_cwl_workflow(
+        self,
+        cwl_data: Union[Dict[str, Any], List[Dict[str, Any]]],
+        auth_token: str = None
+    ) -> Union[Dict[str, str], List[Dict[str, str]]]:
         """Submit a CWL workflow.
 
         This method converts a CWL workflow to custom format and submits it.
         It's a convenience method that combines convert_cwl_workflow() and submit_workflow().
+        A list of CWL workflows is converted and submitted with a single bulk write.
 
         Args:
-            cwl_data: CWL workflow dictionary
+            cwl_data: CWL workflow dictionary, or a list of them
             auth_token: Optional authorization token for scheduler API calls
 
         Returns:
-            Dictionary with workflow_id and status
+            Dictionary with workflow_id and status (a list of them for list input)
 
         Raises:
             ValueError: If conversion or validation fails
@@ -606,6 +1465,12 @@ class WorkflowManager:
         try:
             logger.info("Starting CWL workflow submission")
 
+            if isinstance(cwl_data, list):
+                custom_workflows = [
+                    self.convert_cwl_workflow(cwl_item) for cwl_item in cwl_data
+                ]
+                return self.submit_workflows_bulk(custom_workflows, auth_token=auth_token)
+
             # Convert CWL to custom format
             custom_workflow = self.convert_cwl_workflow(cwl_data)
 
@@ -617,14 +1482,38 @@ class WorkflowManager:
             )
 
         except ValueError as e:
-            logger.error(f"CWL workflow submission failed: {e}")
+            logger.error("CWL workflow submission failed: %s", e)
             raise
         except Exception as e:
-            logger.error(f"CWL workflow submission failed: {e}")
+            logger.error("CWL workflow submission failed: %s", e)
             raise
 
+    async def submit_cwl_workflow_async(
+        self,
+        cwl_data: Union[Dict[str, Any], List[Dict[str, Any]]],
+        auth_token: str = None
+    ) -> Union[Dict[str, str], List[Dict[str, str]]]:
+        """Async variant of submit_cwl_workflow.
+
+        Runs in a worker thread so CWL conversion (itself offloaded to the
+        process pool) and validation do not block the API event loop.
+
+        Args:
+            cwl_data: CWL workflow dictionary or list of them
+            auth_token: Optional authorization token for scheduler API calls
+
+        Returns:
+            Same as submit_cwl_workflow
+        """
+        return await asyncio.to_thread(self.submit_cwl_workflow, cwl_data, auth_token)
+
     def close(self):
         """Clean up resources."""
         logger.info("Closing WorkflowManager")
+        self._io_executor.shutdown(wait=False)
+        if self._cwl_process_pool is not None:
+            self._cwl_process_pool.shutdown(wait=False)
+        self.scheduler_client.close()
+        self.workflow_cache.close()
         self.state_manager.close()
 
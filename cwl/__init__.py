@@ -1,6 +1,6 @@
 """CWL (Common Workflow Language) support for workflow engine."""
-from cwl.converter import CWLConverter
+from cwl.converter import CWLConverter, convert_cwl_document
 from cwl.parser import CWLParser
 
-__all__ = ['CWLConverter', 'CWLParser']
+__all__ = ['CWLConverter', 'CWLParser', 'convert_cwl_document']
 
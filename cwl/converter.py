@@ -1,5 +1,6 @@
 """CWL to custom workflow format converter."""
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Dict, Any, List, Optional, Set
 from pathlib import Path
 
 from cwl.parser import CWLParser
@@ -9,9 +10,17 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Exact types of scalar step inputs that are passed through unchanged
+_PRIMITIVE_TYPES = frozenset({int, float, bool})
+
 
 class CWLConverter:
-    """Converts CWL workflows to custom workflow format."""
+    """Converts CWL workflows to custom workflow format.
+    
+    Conversion keeps no per-call state and only reads the tool mappings
+    loaded in __init__, so one instance can be shared by concurrent threads
+    (apply any add_mapping() calls before sharing it).
+    """
     
     def __init__(self, tool_mappings_file: Optional[Path] = None):
         """Initialize CWL converter.
@@ -120,17 +129,9 @@ class CWLConverter:
         for input_id, input_def in inputs.items():
             # Handle different input definition formats
             if isinstance(input_def, dict):
-                # Get default value if present
-                default_value = input_def.get('default', input_id)
-                # Get type to determine if it's a special input
-                input_type = input_def.get('type', 'string')
-                
-                # For common workflow inputs, map to base_context
-                if input_id == 'workspace_output_folder' or 'workspace' in input_id.lower():
-                    base_context[input_id] = f"${{{input_id}}}"
-                else:
-                    # Store as variable reference
-                    base_context[input_id] = f"${{{input_id}}}"
+                # Typed inputs (workspace folders included) become variable
+                # references resolved from the submitted base_context
+                base_context[input_id] = f"${{{input_id}}}"
             else:
                 # Simple value
                 base_context[input_id] = input_def
@@ -142,7 +143,8 @@ class CWLConverter:
         if 'workspace_output_folder' not in base_context:
             # Try to find a similar field
             for key in base_context.keys():
-                if 'workspace' in key.lower() or 'output' in key.lower():
+                lower_key = key.lower()
+                if 'workspace' in lower_key or 'output' in lower_key:
                     base_context['workspace_output_folder'] = base_context[key]
                     break
             else:
@@ -180,17 +182,17 @@ class CWLConverter:
             else:
                 raise ValueError(f"Step '{step_name}' has invalid tool reference: {tool_ref}")
             
-            # Convert step inputs to params
+            # Convert step inputs to params, collecting the steps they
+            # reference in the same walk
             step_inputs = step_def.get('in', {})
-            params = self._convert_step_inputs(step_inputs)
+            dependencies: Set[str] = set()
+            params = self._convert_step_inputs(step_inputs, dependencies)
+            depends_on = sorted(dependencies)
             
             # Convert step outputs
             step_outputs = step_def.get('out', [])
             outputs = self._convert_step_outputs(step_name, step_outputs, params)
             
-            # Extract dependencies from step inputs
-            depends_on = self.translator.extract_step_dependencies(step_inputs)
-            
             # Build custom step
             custom_step = {
                 'step_name': step_name,
@@ -206,7 +208,49 @@ class CWLConverter:
                 f"dependencies={depends_on}"
             )
         
-        return custom_steps
+        return self._order_steps(custom_steps)
+    
+    def _order_steps(self, custom_steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Order converted steps so each one follows the steps it depends on.
+        
+        Uses Kahn's algorithm seeded in CWL order, so independent steps keep
+        their original relative order. Dependencies on unknown steps are
+        ignored here, and steps left on a cycle are appended in CWL order
+        for the validator to report.
+        
+        Args:
+            custom_steps: Converted steps in CWL order
+            
+        Returns:
+            Steps in a valid execution order
+        """
+        steps_by_name = {step['step_name']: step for step in custom_steps}
+        in_degree = {name: 0 for name in steps_by_name}
+        dependents: Dict[str, List[str]] = {name: [] for name in steps_by_name}
+        
+        for step in custom_steps:
+            for dep in step['depends_on']:
+                if dep in steps_by_name:
+                    in_degree[step['step_name']] += 1
+                    dependents[dep].append(step['step_name'])
+        
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        ordered: List[Dict[str, Any]] = []
+        while ready:
+            name = ready.popleft()
+            ordered.append(steps_by_name[name])
+            for dependent in dependents[name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+        
+        if len(ordered) < len(custom_steps):
+            logger.warning("CWL workflow steps contain a dependency cycle")
+            ordered.extend(
+                step for step in custom_steps if in_degree[step['step_name']] > 0
+            )
+        
+        return ordered
     
     def _extract_app_from_inline_tool(self, tool_def: Dict[str, Any]) -> str:
         """Extract app name from inline CWL tool definition.
@@ -226,11 +270,16 @@ class CWLConverter:
             # Use convention-based conversion
             return "UnknownApp"
     
-    def _convert_step_inputs(self, step_inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def _convert_step_inputs(
+        self,
+        step_inputs: Dict[str, Any],
+        dependencies: Set[str]
+    ) -> Dict[str, Any]:
         """Convert CWL step inputs to params.
         
         Args:
             step_inputs: CWL step inputs dictionary
+            dependencies: Set that receives the names of referenced steps
             
         Returns:
             Params dictionary
@@ -239,42 +288,46 @@ class CWLConverter:
         
         for param_name, input_value in step_inputs.items():
             # Convert CWL input value to param value
-            converted_value = self._convert_input_value(input_value)
+            converted_value = self._convert_input_value(input_value, dependencies)
             params[param_name] = converted_value
         
         return params
     
-    def _convert_input_value(self, value: Any) -> Any:
+    def _convert_input_value(self, value: Any, dependencies: Set[str]) -> Any:
         """Convert a CWL input value to custom format.
         
         Args:
             value: CWL input value (may be expression, file object, or primitive)
+            dependencies: Set that receives the names of referenced steps
             
         Returns:
             Converted value
         """
         if isinstance(value, str):
             # Translate CWL expressions
-            return self.translator.translate_expression(value)
+            return self.translator.translate_and_collect(value, dependencies)
+        
+        elif value is None or type(value) in _PRIMITIVE_TYPES:
+            # Leaf values pass through before the container checks
+            return value
         
         elif isinstance(value, dict):
             # Handle CWL file objects or complex types
-            if 'path' in value:
-                # File object - extract path
-                return value['path']
-            elif 'location' in value:
-                # File location
-                return value['location']
+            if 'path' in value or 'location' in value:
+                # File objects are passed through untranslated, but step
+                # references inside them still count as dependencies
+                self.translator._extract_dependencies_from_value(value, dependencies)
+                return value['path'] if 'path' in value else value['location']
             else:
                 # Recursively convert nested structures
                 return {
-                    k: self._convert_input_value(v)
+                    k: self._convert_input_value(v, dependencies)
                     for k, v in value.items()
                 }
         
         elif isinstance(value, list):
             # Convert list items
-            return [self._convert_input_value(item) for item in value]
+            return [self._convert_input_value(item, dependencies) for item in value]
         
         else:
             # Primitive type - return as-is
@@ -296,26 +349,19 @@ class CWLConverter:
         Returns:
             Outputs dictionary
         """
-        outputs = {}
-        
-        for output_id in step_outputs:
-            # Generate output path using convention
-            # Try to use output_path from params if available
-            if 'output_path' in params:
-                base_path = params['output_path']
-                if isinstance(base_path, str):
-                    # Remove ${} wrapper if present for path construction
-                    clean_path = base_path.replace('${', '').replace('}', '')
-                    output_path = f"${{params.output_path}}/{output_id}"
-                else:
-                    output_path = f"{base_path}/{output_id}"
-            else:
-                # Use default pattern
-                output_path = f"${{params.output_path}}/{output_id}"
-            
-            outputs[output_id] = output_path
+        # Output paths hang off the step's output_path param; a non-string
+        # output_path value is used literally, otherwise the reference is
+        # left for the resolver
+        base_path = params.get('output_path')
+        if 'output_path' in params and not isinstance(base_path, str):
+            prefix = f"{base_path}"
+        else:
+            prefix = "${params.output_path}"
         
-        return outputs
+        return {
+            output_id: f"{prefix}/{output_id}"
+            for output_id in step_outputs
+        }
     
     def _convert_workflow_outputs(self, cwl_outputs: List[Any]) -> List[str]:
         """Convert CWL workflow outputs to custom format.
@@ -347,3 +393,34 @@ class CWLConverter:
         
         return workflow_outputs
 
+
+
+# Per-process parser/converter reused by convert_cwl_document, from pool
+# workers and request threads alike (tool mappings are loaded once per
+# process rather than once per conversion)
+_worker_parser: Optional[CWLParser] = None
+_worker_converter: Optional[CWLConverter] = None
+
+
+def convert_cwl_document(cwl_data: Any) -> Dict[str, Any]:
+    """Parse, validate and convert a CWL document in the current process.
+    
+    Module-level so it can be shipped to a process pool by reference.
+    
+    Args:
+        cwl_data: CWL workflow dictionary or raw YAML/JSON text
+        
+    Returns:
+        Custom workflow format dictionary
+        
+    Raises:
+        ValueError: If parsing, validation or conversion fails
+    """
+    global _worker_parser, _worker_converter
+    if _worker_converter is None:
+        _worker_parser = CWLParser()
+        _worker_converter = CWLConverter()
+    
+    cwl_workflow = _worker_parser.parse_cwl(cwl_data)
+    _worker_parser.validate_cwl_workflow(cwl_workflow)
+    return _worker_converter.convert(cwl_workflow)
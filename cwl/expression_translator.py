@@ -1,6 +1,7 @@
 """Expression translator for converting CWL expressions to custom format."""
 import re
-from typing import Dict, Any, List, Set
+from functools import lru_cache
+from typing import Dict, Any, List, Set, Tuple
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +19,17 @@ class ExpressionTranslator:
     # Pattern to match input references: inputs.input_name
     INPUT_PATTERN = re.compile(r'^inputs\.([a-zA-Z_][a-zA-Z0-9_]*)$')
     
+    # Single pattern for every simple reference form, so one match decides
+    # the translation: steps.step_name.output_name, inputs.input_name,
+    # self.<anything> or a bare input_name
+    REFERENCE_PATTERN = re.compile(
+        r'^(?:steps\.(?P<step>[a-zA-Z_][a-zA-Z0-9_]*)\.(?P<output>[a-zA-Z_][a-zA-Z0-9_]*)'
+        r'|inputs\.(?P<input>[a-zA-Z_][a-zA-Z0-9_]*)'
+        r'|self\.(?P<self_ref>.*)'
+        r'|(?P<ident>[a-zA-Z_][a-zA-Z0-9_]*))$',
+        re.DOTALL
+    )
+    
     @staticmethod
     def translate_expression(cwl_expr: str, context: Dict[str, Any] = None) -> str:
         """Translate CWL expression to custom format.
@@ -32,18 +44,37 @@ class ExpressionTranslator:
         if not isinstance(cwl_expr, str):
             return cwl_expr
         
-        # Find all CWL expressions
-        matches = ExpressionTranslator.CWL_EXPRESSION_PATTERN.findall(cwl_expr)
-        
-        if not matches:
+        # Most values are literals; a substring scan is far cheaper than the regex
+        if '$(' not in cwl_expr:
             return cwl_expr
         
-        translated = cwl_expr
-        for match in matches:
-            translated_expr = ExpressionTranslator._translate_single_expression(match)
-            translated = translated.replace(f"$({match})", translated_expr)
+        # Translate every CWL expression in a single pass over the string
+        return ExpressionTranslator.CWL_EXPRESSION_PATTERN.sub(
+            lambda match: ExpressionTranslator._translate_single_expression(match.group(1)),
+            cwl_expr
+        )
+    
+    @staticmethod
+    def translate_and_collect(cwl_expr: str, dependencies: Set[str]) -> str:
+        """Translate CWL expressions and record referenced steps in one pass.
         
-        return translated
+        Args:
+            cwl_expr: CWL expression string (may contain $(...))
+            dependencies: Set that receives the names of referenced steps
+            
+        Returns:
+            Translated expression in custom format
+        """
+        def translate_match(match: "re.Match") -> str:
+            expr = match.group(1)
+            step_match = ExpressionTranslator.STEP_OUTPUT_PATTERN.match(expr.strip())
+            if step_match:
+                dependencies.add(step_match.group(1))
+            return ExpressionTranslator._translate_single_expression(expr)
+        
+        if '$(' not in cwl_expr:
+            return cwl_expr
+        return ExpressionTranslator.CWL_EXPRESSION_PATTERN.sub(translate_match, cwl_expr)
     
     @staticmethod
     def _translate_single_expression(expr: str) -> str:
@@ -56,38 +87,14 @@ class ExpressionTranslator:
             Translated expression in custom format
         """
         expr = expr.strip()
-        
-        # Check for step output reference: steps.step_name.output_name
-        step_match = ExpressionTranslator.STEP_OUTPUT_PATTERN.match(expr)
-        if step_match:
-            step_name = step_match.group(1)
-            output_name = step_match.group(2)
-            return f"${{steps.{step_name}.outputs.{output_name}}}"
-        
-        # Check for input reference: inputs.input_name
-        input_match = ExpressionTranslator.INPUT_PATTERN.match(expr)
-        if input_match:
-            input_name = input_match.group(1)
-            # Inputs become params in step context, or base_context at workflow level
-            return f"${{{input_name}}}"
-        
-        # Check for self reference (workflow-level input)
-        if expr.startswith('self.'):
-            input_name = expr[5:]  # Remove 'self.' prefix
-            return f"${{{input_name}}}"
-        
-        # For other expressions, try to convert common patterns
-        # If it's just a variable name, wrap it
-        if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', expr):
-            return f"${{{expr}}}"
-        
-        # Complex expression - log warning and try to convert
-        logger.warning(
-            f"Complex CWL expression detected: $({expr}). "
-            "May need manual review after conversion."
-        )
-        # Try to convert $(...) to ${...} format
-        return f"${{{expr}}}"
+        translated, is_complex = _translate_stripped_expression(expr)
+        if is_complex:
+            # Logged outside the cache so every occurrence is still reported
+            logger.warning(
+                f"Complex CWL expression detected: $({expr}). "
+                "May need manual review after conversion."
+            )
+        return translated
     
     @staticmethod
     def extract_step_dependencies(step_inputs: Dict[str, Any]) -> List[str]:
@@ -102,41 +109,71 @@ class ExpressionTranslator:
         dependencies: Set[str] = set()
         
         for input_value in step_inputs.values():
-            deps = ExpressionTranslator._extract_dependencies_from_value(input_value)
-            dependencies.update(deps)
+            ExpressionTranslator._extract_dependencies_from_value(input_value, dependencies)
         
-        return sorted(list(dependencies))
+        return sorted(dependencies)
     
     @staticmethod
-    def _extract_dependencies_from_value(value: Any) -> List[str]:
+    def _extract_dependencies_from_value(value: Any, dependencies: Set[str]) -> None:
         """Recursively extract step dependencies from a value.
         
         Args:
             value: Value that may contain step references
-            
-        Returns:
-            List of step names referenced
+            dependencies: Set that receives the names of referenced steps
         """
-        dependencies: Set[str] = set()
-        
         if isinstance(value, str):
+            if '$(' not in value:
+                return
             # Check for step references in string
-            matches = ExpressionTranslator.CWL_EXPRESSION_PATTERN.findall(value)
-            for match in matches:
-                step_match = ExpressionTranslator.STEP_OUTPUT_PATTERN.match(match.strip())
+            for match in ExpressionTranslator.CWL_EXPRESSION_PATTERN.finditer(value):
+                step_match = ExpressionTranslator.STEP_OUTPUT_PATTERN.match(
+                    match.group(1).strip()
+                )
                 if step_match:
-                    step_name = step_match.group(1)
-                    dependencies.add(step_name)
+                    dependencies.add(step_match.group(1))
         
         elif isinstance(value, dict):
             for v in value.values():
-                deps = ExpressionTranslator._extract_dependencies_from_value(v)
-                dependencies.update(deps)
+                ExpressionTranslator._extract_dependencies_from_value(v, dependencies)
         
         elif isinstance(value, list):
             for item in value:
-                deps = ExpressionTranslator._extract_dependencies_from_value(item)
-                dependencies.update(deps)
-        
-        return list(dependencies)
+                ExpressionTranslator._extract_dependencies_from_value(item, dependencies)
+
 
+@lru_cache(maxsize=4096)
+def _translate_stripped_expression(expr: str) -> Tuple[str, bool]:
+    """Translate a stripped CWL expression, memoized across calls.
+    
+    Workflows reference the same inputs and step outputs many times, and
+    the result depends only on the expression text.
+    
+    Args:
+        expr: Stripped CWL expression content (without $(...))
+        
+    Returns:
+        Tuple of (translated expression, whether it is a complex expression)
+    """
+    match = ExpressionTranslator.REFERENCE_PATTERN.match(expr)
+    if match is None:
+        # Complex expression - try to convert $(...) to ${...} format
+        return f"${{{expr}}}", True
+    
+    # Step output reference: steps.step_name.output_name
+    step_name = match.group('step')
+    if step_name is not None:
+        return f"${{steps.{step_name}.outputs.{match.group('output')}}}", False
+    
+    # Input reference: inputs.input_name. Inputs become params in step
+    # context, or base_context at workflow level
+    input_name = match.group('input')
+    if input_name is not None:
+        return f"${{{input_name}}}", False
+    
+    # Self reference (workflow-level input)
+    self_ref = match.group('self_ref')
+    if self_ref is not None:
+        return f"${{{self_ref}}}", False
+    
+    # Bare variable name
+    return f"${{{expr}}}", False
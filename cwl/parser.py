@@ -1,12 +1,30 @@
 """CWL parser for loading and validating CWL workflow files."""
 import json
+import threading
 import yaml
-from typing import Dict, Any, Optional, Union
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Dict, Any, Optional, Tuple, Union
 from pathlib import Path
+from utils.json_codec import loads
 from utils.logger import get_logger
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = get_logger(__name__)
 
+# Parsed YAML CWL files kept in process memory, keyed by (resolved path,
+# mtime_ns, size) so an edited file is parsed again. Entries are private
+# deep copies and every hit returns a fresh deep copy, so callers may
+# mutate the result and YAML-only values (non-string keys, dates) survive.
+PARSED_FILE_CACHE_SIZE = 64
+_parsed_file_cache: "OrderedDict[Tuple[Path, int, int], Any]" = OrderedDict()
+_parsed_file_cache_lock = threading.Lock()
+
 
 class CWLParser:
     """Parser for CWL workflow files."""
@@ -52,9 +70,16 @@ class CWLParser:
         if isinstance(data, Path):
             return CWLParser._parse_file(data)
         elif isinstance(data, str):
+            # JSON documents skip the much slower YAML parser; flow-style
+            # YAML can also start with '{' so fall through if it is not JSON
+            if data.lstrip()[:1] in ('{', '['):
+                try:
+                    return loads(data)
+                except ValueError:
+                    pass
             # Try to parse as YAML first, then JSON
             try:
-                return yaml.safe_load(data)
+                return yaml.load(data, Loader=_SafeLoader)
             except yaml.YAMLError:
                 try:
                     return json.loads(data)
@@ -80,18 +105,47 @@ class CWLParser:
         if not file_path.exists():
             raise ValueError(f"CWL file not found: {file_path}")
         
-        with open(file_path, 'r') as f:
-            if file_path.suffix in ['.yaml', '.yml']:
-                return yaml.safe_load(f)
-            elif file_path.suffix == '.json':
-                return json.load(f)
-            else:
-                # Try YAML first, then JSON
-                content = f.read()
-                try:
-                    return yaml.safe_load(content)
-                except yaml.YAMLError:
-                    return json.loads(content)
+        if file_path.suffix == '.json':
+            return loads(file_path.read_bytes())
+        
+        stat = file_path.stat()
+        cache_key = (file_path.resolve(), stat.st_mtime_ns, stat.st_size)
+        with _parsed_file_cache_lock:
+            cached = _parsed_file_cache.get(cache_key)
+            if cached is not None:
+                _parsed_file_cache.move_to_end(cache_key)
+        if cached is not None:
+            return deepcopy(cached)
+        
+        # Read raw bytes and let the C parsers decode them once
+        content = file_path.read_bytes()
+        
+        if file_path.suffix in ['.yaml', '.yml']:
+            parsed = yaml.load(content, Loader=_SafeLoader)
+        else:
+            # Try YAML first, then JSON
+            try:
+                parsed = yaml.load(content, Loader=_SafeLoader)
+            except yaml.YAMLError:
+                return loads(content)
+        
+        CWLParser._cache_parsed_file(cache_key, parsed)
+        return parsed
+    
+    @staticmethod
+    def _cache_parsed_file(cache_key: Tuple[Path, int, int], parsed: Any) -> None:
+        """Remember a private copy of a parsed CWL file in process memory.
+        
+        Args:
+            cache_key: (resolved path, mtime_ns, size) of the source file
+            parsed: Parsed workflow (returned to the caller, so copied here)
+        """
+        entry = deepcopy(parsed)
+        with _parsed_file_cache_lock:
+            _parsed_file_cache[cache_key] = entry
+            _parsed_file_cache.move_to_end(cache_key)
+            while len(_parsed_file_cache) > PARSED_FILE_CACHE_SIZE:
+                _parsed_file_cache.popitem(last=False)
     
     @staticmethod
     def validate_cwl_workflow(cwl_data: Dict[str, Any]) -> bool:
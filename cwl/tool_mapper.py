@@ -1,11 +1,23 @@
 """Tool mapper for converting CWL tool references to app names."""
+import threading
 import yaml
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 from utils.logger import get_logger
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = get_logger(__name__)
 
+# Parsed mappings shared by every ToolMapper in the process, keyed by
+# (mappings file, mtime_ns) so an edited file is picked up by new mappers
+_mappings_cache: Dict[Tuple[Path, int], Dict[str, str]] = {}
+_mappings_cache_lock = threading.Lock()
+
 
 class ToolMapper:
     """Maps CWL tools to application names."""
@@ -22,30 +34,60 @@ class ToolMapper:
             mappings_file = cwl_dir / "config" / "tool_mappings.yaml"
         
         self.mappings_file = Path(mappings_file)
-        self.tool_mappings: Dict[str, str] = {}
-        self._load_mappings()
+        # Mappings are loaded on first use; add_mapping() entries are kept
+        # apart so the shared parsed file is never modified
+        self._file_mappings: Optional[Dict[str, str]] = None
+        self._overrides: Dict[str, str] = {}
+        self._merged_mappings: Optional[Dict[str, str]] = None
+        # Resolved app name per tool reference; cleared when mappings change
+        self._resolved_apps: Dict[str, str] = {}
+    
+    @property
+    def tool_mappings(self) -> Dict[str, str]:
+        """Tool mappings from the mappings file plus any added mappings."""
+        if self._file_mappings is None:
+            self._file_mappings = self._load_mappings()
+        if not self._overrides:
+            return self._file_mappings
+        if self._merged_mappings is None:
+            self._merged_mappings = {**self._file_mappings, **self._overrides}
+        return self._merged_mappings
     
-    def _load_mappings(self):
-        """Load tool mappings from configuration file."""
-        if not self.mappings_file.exists():
+    def _load_mappings(self) -> Dict[str, str]:
+        """Load tool mappings from the configuration file, once per process.
+        
+        Returns:
+            Parsed tool mappings (shared; must not be modified)
+        """
+        try:
+            mtime_ns = self.mappings_file.stat().st_mtime_ns
+        except OSError:
             logger.warning(
                 f"Tool mappings file not found: {self.mappings_file}. "
                 "Using empty mappings. Create the file to map CWL tools to app names."
             )
-            self.tool_mappings = {}
-            return
+            return {}
         
-        try:
-            with open(self.mappings_file, 'r') as f:
-                config = yaml.safe_load(f) or {}
-                self.tool_mappings = config.get('tool_mappings', {})
+        cache_key = (self.mappings_file.resolve(), mtime_ns)
+        with _mappings_cache_lock:
+            cached = _mappings_cache.get(cache_key)
+            if cached is not None:
+                return cached
             
-            logger.info(
-                f"Loaded {len(self.tool_mappings)} tool mappings from {self.mappings_file}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to load tool mappings: {e}")
-            self.tool_mappings = {}
+            try:
+                with open(self.mappings_file, 'r') as f:
+                    config = yaml.load(f, Loader=_SafeLoader) or {}
+                    tool_mappings = config.get('tool_mappings', {})
+                
+                logger.info(
+                    f"Loaded {len(tool_mappings)} tool mappings from {self.mappings_file}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to load tool mappings: {e}")
+                return {}
+            
+            _mappings_cache[cache_key] = tool_mappings
+            return tool_mappings
     
     def map_tool_to_app(self, tool_ref: str) -> str:
         """Map CWL tool reference to application name.
@@ -59,6 +101,23 @@ class ToolMapper:
         Raises:
             ValueError: If tool mapping not found
         """
+        app_name = self._resolved_apps.get(tool_ref)
+        if app_name is not None:
+            return app_name
+        
+        app_name = self._resolve_tool(tool_ref)
+        self._resolved_apps[tool_ref] = app_name
+        return app_name
+    
+    def _resolve_tool(self, tool_ref: str) -> str:
+        """Resolve a tool reference against the mappings and naming convention.
+        
+        Args:
+            tool_ref: CWL tool reference (filename, path, or ID)
+            
+        Returns:
+            Application name
+        """
         # Try exact match first
         if tool_ref in self.tool_mappings:
             app_name = self.tool_mappings[tool_ref]
@@ -112,6 +171,8 @@ class ToolMapper:
             tool_ref: CWL tool reference
             app_name: Application name
         """
-        self.tool_mappings[tool_ref] = app_name
+        self._overrides[tool_ref] = app_name
+        self._merged_mappings = None
+        self._resolved_apps.clear()
         logger.debug(f"Added mapping: '{tool_ref}' -> '{app_name}'")
 
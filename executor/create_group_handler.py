@@ -1,11 +1,12 @@
 """CreateGroup step handler - executes group creation steps directly."""
 import asyncio
 import time
-import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from utils.logger import get_logger
+from utils.ulid import new_ulid
 from utils.workflow_logger import WorkflowLogger
 from utils.variable_resolver import VariableResolver
 from utils import metrics
@@ -29,14 +30,22 @@ class CreateGroupHandler:
     not submitted to the scheduler.
     """
     
-    def __init__(self, state_manager):
+    def __init__(self, state_manager, max_workers: int = 4):
         """Initialize CreateGroup handler.
         
         Args:
             state_manager: MongoDB state manager for workflow state updates
+            max_workers: Maximum number of group creations run concurrently
         """
         self.state_manager = state_manager
         
+        # Group creation makes long blocking HTTP calls; a dedicated pool keeps
+        # it from occupying the default executor used by asyncio.to_thread
+        self._group_pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='create-group'
+        )
+        
         if not GROUPS_MODULE_AVAILABLE:
             logger.warning(
                 "bvbrc_groups_module not available - CreateGroup steps will fail"
@@ -51,7 +60,8 @@ class CreateGroupHandler:
         dag,
         mark_step_running,
         mark_step_completed,
-        mark_step_failed
+        mark_step_failed,
+        workflow_steps: Optional[List[Dict[str, Any]]] = None
     ) -> None:
         """Handle CreateGroup step execution.
         
@@ -68,6 +78,8 @@ class CreateGroupHandler:
             mark_step_running: Callback to mark step as running
             mark_step_completed: Callback to mark step as completed
             mark_step_failed: Callback to mark step as failed
+            workflow_steps: Current workflow steps for resolving step references;
+                read from MongoDB when not provided
         """
         step_name = step.get('step_name')
         params = step.get('params', {})
@@ -89,14 +101,16 @@ class CreateGroupHandler:
         
         # Mark step as running
         logger.info(f"Workflow {workflow_id}: Marking CreateGroup step '{step_name}' as running")
-        self.state_manager.update_step_by_name(
+        started_at = datetime.now(timezone.utc)
+        await asyncio.to_thread(
+            self.state_manager.update_step_by_name,
             workflow_id,
             step_name,
             {
                 'step_id': step_id,
                 'status': 'running',
-                'submitted_at': datetime.utcnow(),
-                'started_at': datetime.utcnow()
+                'submitted_at': started_at,
+                'started_at': started_at
             }
         )
         
@@ -104,10 +118,10 @@ class CreateGroupHandler:
         mark_step_running(step_name)
         
         # Update DAG node status
-        node_id = step_name
-        if node_id in dag.nodes:
-            dag.nodes[node_id]['status'] = 'running'
-            dag.nodes[node_id]['step_id'] = step_id
+        node_attrs = dag.nodes.get(step_name)
+        if node_attrs is not None:
+            node_attrs['status'] = 'running'
+            node_attrs['step_id'] = step_id
         
         # Log start
         WorkflowLogger.log_workflow_event(
@@ -118,9 +132,13 @@ class CreateGroupHandler:
         
         # Resolve params (may contain variable references to previous steps)
         try:
-            workflow_doc = self.state_manager.get_workflow(workflow_id)
-            if workflow_doc:
-                workflow_steps = workflow_doc.get('steps', [])
+            if workflow_steps is None:
+                workflow_doc = await asyncio.to_thread(
+                    self.state_manager.get_workflow, workflow_id
+                )
+                if workflow_doc:
+                    workflow_steps = workflow_doc.get('steps', [])
+            if workflow_steps is not None:
                 params = VariableResolver.resolve_step_params_runtime(
                     params,
                     workflow_steps
@@ -185,12 +203,11 @@ class CreateGroupHandler:
         
         # Execute group creation asynchronously to avoid blocking
         try:
-            start_time = datetime.utcnow()
+            start_ns = time.monotonic_ns()
             
             # Run group creation in executor to avoid blocking the event loop
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,  # Use default executor
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._group_pool,
                 self._execute_group_creation,
                 job_result_paths,
                 group_type,
@@ -200,9 +217,12 @@ class CreateGroupHandler:
                 auth_token
             )
             
-            end_time = datetime.utcnow()
-            elapsed = end_time - start_time
-            elapsed_str = str(elapsed).split('.')[0]  # Remove microseconds
+            end_time = datetime.now(timezone.utc)
+            # Whole seconds as HH:MM:SS, the format the scheduler reports
+            elapsed_s = (time.monotonic_ns() - start_ns) // 1_000_000_000
+            elapsed_str = (
+                f"{elapsed_s // 3600:02d}:{elapsed_s // 60 % 60:02d}:{elapsed_s % 60:02d}"
+            )
             
             # Check if group creation succeeded
             if not result.get('success'):
@@ -246,8 +266,9 @@ class CreateGroupHandler:
             else:
                 step_outputs = {'group_path': group_path}
             
-            # Mark step as completed
-            self.state_manager.update_step_fields(
+            # Mark step as completed and update workflow metadata in one write
+            await asyncio.to_thread(
+                self.state_manager.complete_step,
                 workflow_id,
                 step_id,
                 {
@@ -258,17 +279,14 @@ class CreateGroupHandler:
                 }
             )
             
-            # Update workflow metadata
-            self.state_manager.add_to_completed_steps(workflow_id, step_id)
-            
             # Update context
             mark_step_completed(step_name)
             
             # Update DAG node status
-            if node_id in dag.nodes:
-                dag.nodes[node_id]['status'] = 'succeeded'
-                dag.nodes[node_id]['completed_at'] = end_time
-                dag.nodes[node_id]['outputs'] = step_outputs
+            if node_attrs is not None:
+                node_attrs['status'] = 'succeeded'
+                node_attrs['completed_at'] = end_time
+                node_attrs['outputs'] = step_outputs
             
             # Log completion with details
             WorkflowLogger.log_step_completion(
@@ -278,26 +296,30 @@ class CreateGroupHandler:
             )
             
             # Log detailed results for user
-            result_summary = f"CreateGroup results:\n"
-            result_summary += f"  - Group created at: {group_path}\n"
-            result_summary += f"  - Total IDs: {ids_count}\n"
-            result_summary += f"  - Jobs processed: {jobs_processed}"
+            summary_lines = [
+                "CreateGroup results:",
+                f"  - Group created at: {group_path}",
+                f"  - Total IDs: {ids_count}",
+                f"  - Jobs processed: {jobs_processed}"
+            ]
             if jobs_skipped > 0:
-                result_summary += f"\n  - Jobs skipped: {jobs_skipped}"
+                summary_lines.append(f"  - Jobs skipped: {jobs_skipped}")
             
             # Add statistics if available
             if 'statistics' in result:
                 stats = result['statistics']
-                result_summary += f"\n  - Statistics:"
-                result_summary += f"\n    * IDs extracted: {stats.get('total_ids_extracted', 0)}"
-                result_summary += f"\n    * Unique IDs: {stats.get('unique_ids', 0)}"
-                result_summary += f"\n    * Valid IDs: {stats.get('valid_ids', 0)}"
+                summary_lines.extend([
+                    "  - Statistics:",
+                    f"    * IDs extracted: {stats.get('total_ids_extracted', 0)}",
+                    f"    * Unique IDs: {stats.get('unique_ids', 0)}",
+                    f"    * Valid IDs: {stats.get('valid_ids', 0)}"
+                ])
                 if stats.get('invalid_ids', 0) > 0:
-                    result_summary += f"\n    * Invalid IDs: {stats.get('invalid_ids', 0)}"
+                    summary_lines.append(f"    * Invalid IDs: {stats.get('invalid_ids', 0)}")
             
             WorkflowLogger.log_workflow_event(
                 workflow_logger,
-                result_summary,
+                "\n".join(summary_lines),
                 level="INFO"
             )
             
@@ -385,44 +407,29 @@ class CreateGroupHandler:
             f"Workflow {workflow_id}: CreateGroup step '{step_name}' failed: {error_message}"
         )
         
-        # Update step in MongoDB (use step_id if available, otherwise step_name)
-        if step_id:
-            self.state_manager.update_step_fields(
-                workflow_id,
-                step_id,
-                {
-                    'status': 'failed',
-                    'error_message': error_message,
-                    'completed_at': datetime.utcnow()
-                }
-            )
-        else:
-            # If step_id not generated yet, update by name
-            self.state_manager.update_step_by_name(
-                workflow_id,
-                step_name,
-                {
-                    'status': 'failed',
-                    'error_message': error_message,
-                    'completed_at': datetime.utcnow()
-                }
-            )
-        
-        # Update workflow metadata
-        self.state_manager.increment_workflow_field(
+        # Update step and workflow metadata in one write (match by step_id
+        # if available, otherwise step_name). PyMongo calls block, so they
+        # run in a worker thread to keep the executor loop responsive.
+        await asyncio.to_thread(
+            self.state_manager.fail_step,
             workflow_id,
-            'execution_metadata.failed_steps',
-            1
+            {
+                'status': 'failed',
+                'error_message': error_message,
+                'completed_at': datetime.now(timezone.utc)
+            },
+            step_id=step_id,
+            step_name=step_name
         )
         
         # Update context
         mark_step_failed(step_name)
         
         # Update DAG node status
-        node_id = step_name
-        if node_id in dag.nodes:
-            dag.nodes[node_id]['status'] = 'failed'
-            dag.nodes[node_id]['error_message'] = error_message
+        node_attrs = dag.nodes.get(step_name)
+        if node_attrs is not None:
+            node_attrs['status'] = 'failed'
+            node_attrs['error_message'] = error_message
         
         # Log failure
         WorkflowLogger.log_step_failure(
@@ -434,6 +441,10 @@ class CreateGroupHandler:
         # Record metrics
         metrics.record_step_completed("CreateGroup", 'failed')
     
+    def close(self) -> None:
+        """Shut down the group creation pool without waiting for running jobs."""
+        self._group_pool.shutdown(wait=False, cancel_futures=True)
+    
     @staticmethod
     def _generate_local_step_id(step_name: str) -> str:
         """Generate a local step ID for non-scheduler steps.
@@ -447,7 +458,5 @@ class CreateGroupHandler:
         Returns:
             Generated step ID
         """
-        timestamp = int(time.time() * 1000)
-        random_part = random.randint(1000, 9999)
-        return f"local_{step_name}_{timestamp}_{random_part}"
+        return f"local_{step_name}_{new_ulid()}"
 
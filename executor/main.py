@@ -6,6 +6,7 @@ Run this as a separate process from the API server:
 import sys
 import asyncio
 import signal
+from typing import Optional
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -23,18 +24,27 @@ logger = get_logger(__name__)
 # Global executor instance
 executor: WorkflowExecutor = None
 
+# Set by the signal handlers to let main() fall through to shutdown
+stop_event: Optional[asyncio.Event] = None
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals gracefully."""
-    logger.info(f"Received signal {signum}, initiating shutdown...")
-    if executor:
-        asyncio.create_task(executor.stop())
-    sys.exit(0)
+
+def request_shutdown(signum: int) -> None:
+    """Handle shutdown signals gracefully.
+
+    Runs on the event loop (registered via loop.add_signal_handler), so it
+    only wakes main(); the executor is stopped by main()'s finally block.
+
+    Args:
+        signum: Received signal number
+    """
+    logger.info("Received signal %s, initiating shutdown...", signal.Signals(signum).name)
+    if stop_event is not None:
+        stop_event.set()
 
 
 async def main():
     """Main executor loop."""
-    global executor
+    global executor, stop_event
     
     try:
         logger.info("=" * 60)
@@ -68,23 +78,24 @@ async def main():
         )
         logger.info("✓ WorkflowExecutor initialized")
         
-        # Register signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        logger.info("✓ Signal handlers registered")
-        
         # Start executor
         await executor.start()
         
+        # Register signal handlers for graceful shutdown
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, request_shutdown, sig)
+        logger.info("✓ Signal handlers registered")
+        
         logger.info("=" * 60)
         logger.info("Workflow Executor is running")
         logger.info(f"Polling interval: {executor.polling_interval}s")
         logger.info("Press Ctrl+C to stop")
         logger.info("=" * 60)
         
-        # Keep running
-        while True:
-            await asyncio.sleep(1)
+        # Keep running until a shutdown signal arrives
+        await stop_event.wait()
     
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
@@ -6,6 +6,7 @@ import logging
 import networkx as nx
 
 from core.dag_analyzer import DAGAnalyzer
+from utils.token_crypto import get_token_cipher
 from utils.workflow_logger import WorkflowLogger
 
 
@@ -41,17 +42,27 @@ class WorkflowExecutionContext:
     last_poll_time: Optional[datetime] = None
     total_steps: int = 0
     
+    # Pending steps whose predecessors have all completed, in discovery
+    # order. Seeded by one DAG scan on first use, then extended from the
+    # successors of each completed step; None means it must be rebuilt.
+    _ready_frontier: Optional[Dict[str, None]] = field(
+        default=None, init=False, repr=False
+    )
+    
     @classmethod
     def build_from_workflow_document(
         cls,
         workflow_doc: Dict[str, Any],
-        log_dir: str = "logs/workflows"
+        log_dir: str = "logs/workflows",
+        auth_doc: Optional[Dict[str, Any]] = None
     ) -> 'WorkflowExecutionContext':
         """Build execution context from MongoDB workflow document.
         
         Args:
             workflow_doc: Workflow document from MongoDB
             log_dir: Directory for workflow logs
+            auth_doc: Document from the workflow_auth collection, if any
+                (older workflows keep their token in workflow_doc)
             
         Returns:
             WorkflowExecutionContext instance
@@ -59,7 +70,7 @@ class WorkflowExecutionContext:
         workflow_id = workflow_doc['workflow_id']
         workflow_name = workflow_doc['workflow_name']
         status = workflow_doc.get('status', 'pending')
-        auth_token = workflow_doc.get('auth_token')
+        auth_token = get_token_cipher().reveal(auth_doc or workflow_doc)
         
         # Build DAG
         dag = DAGAnalyzer.build_dag_from_workflow(workflow_doc)
@@ -131,7 +142,34 @@ class WorkflowExecutionContext:
         Returns:
             List of step dictionaries ready for submission
         """
-        return DAGAnalyzer.get_ready_steps(self.dag, self.completed_steps)
+        if self._ready_frontier is None:
+            self._ready_frontier = {
+                step['step_name']: None
+                for step in DAGAnalyzer.get_ready_steps(self.dag, self.completed_steps)
+                if step.get('step_name')
+            }
+        
+        ready = []
+        for step_name in list(self._ready_frontier):
+            step_data = self.dag.nodes[step_name]
+            if step_data.get('status', 'pending') != 'pending':
+                # Submitted or otherwise resolved; steps never return to pending
+                del self._ready_frontier[step_name]
+                continue
+            ready.append(dict(step_data))
+        return ready
+    
+    def get_workflow_steps(self) -> List[Dict[str, Any]]:
+        """Get the current step dictionaries held on the DAG nodes.
+        
+        The executor keeps node data (status, params, outputs) in step with
+        what it writes to MongoDB, so this can stand in for re-reading the
+        workflow document.
+        
+        Returns:
+            List of step dictionaries
+        """
+        return [data for _, data in self.dag.nodes(data=True)]
     
     def get_running_steps_list(self) -> List[Dict[str, Any]]:
         """Get list of currently running steps.
@@ -171,9 +209,17 @@ class WorkflowExecutionContext:
         Args:
             step_name: Step name (used as identifier in DAG)
         """
-        if step_name in self.running_steps:
-            self.running_steps.remove(step_name)
+        self.running_steps.discard(step_name)
         self.completed_steps.add(step_name)
+        
+        # Only this step's successors can have become ready
+        if self._ready_frontier is not None and step_name in self.dag:
+            for successor in self.dag.successors(step_name):
+                if all(
+                    predecessor in self.completed_steps
+                    for predecessor in self.dag.predecessors(successor)
+                ):
+                    self._ready_frontier[successor] = None
     
     def mark_step_failed(self, step_name: str) -> None:
         """Mark a step as failed.
@@ -181,8 +227,7 @@ class WorkflowExecutionContext:
         Args:
             step_name: Step name (used as identifier in DAG)
         """
-        if step_name in self.running_steps:
-            self.running_steps.remove(step_name)
+        self.running_steps.discard(step_name)
         self.failed_steps.add(step_name)
     
     def mark_step_running(self, step_name: str) -> None:
@@ -211,6 +256,7 @@ class WorkflowExecutionContext:
         """
         # Rebuild DAG with updated step data
         self.dag = DAGAnalyzer.build_dag_from_workflow(workflow_doc)
+        self._ready_frontier = None
         
         # Update status
         self.status = workflow_doc.get('status', self.status)
@@ -1,16 +1,17 @@
 """Workflow executor - orchestrates DAG-based workflow execution."""
 import asyncio
-import json
 import time
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from pymongo.errors import OperationFailure
 
 from core.state_manager import StateManager
 from scheduler.client import SchedulerClient
 from executor.workflow_context import WorkflowExecutionContext
 from executor.create_group_handler import CreateGroupHandler
+from utils.json_codec import LazyJson
 from utils.logger import get_logger
 from utils.workflow_logger import WorkflowLogger
 from utils.variable_resolver import VariableResolver
@@ -34,6 +35,18 @@ CGA_RECIPES = {
 CGA_DOMAINS = {"Bacteria", "Archaea", "Viruses", "auto"}
 CGA_CODES = {0, 1, 4, 11, 25}
 
+# Name under which the pending-workflow change stream resume token is stored
+PENDING_WATCH_NAME = "pending_workflows"
+
+# Server error codes: change streams unsupported (standalone mongod), and a
+# resume token that is no longer in the oplog (CappedPositionLost,
+# ChangeStreamFatalError, ChangeStreamHistoryLost)
+CHANGE_STREAM_UNSUPPORTED_CODES = frozenset({40573})
+RESUME_TOKEN_REJECTED_CODES = frozenset({136, 280, 286})
+
+# Upper bound on the delay between attempts to reopen the change stream
+CHANGE_STREAM_MAX_BACKOFF_SECONDS = 300
+
 
 class WorkflowExecutor:
     """Orchestrates DAG-based workflow execution.
@@ -71,15 +84,23 @@ class WorkflowExecutor:
         self.scheduler = AsyncIOScheduler()
         
         # CreateGroup handler
-        self.create_group_handler = CreateGroupHandler(state_manager)
+        self.create_group_handler = CreateGroupHandler(
+            state_manager,
+            max_workers=config.executor.get('create_group_concurrency', 4)
+        )
         
         # Configuration
         self.polling_interval = config.executor.get('polling_interval_seconds', 10)
         self.enable_auto_resume = config.executor.get('enable_auto_resume', True)
+        self.use_change_streams = config.executor.get('use_change_streams', True)
         
         # Shutdown flag
         self._shutdown = False
         
+        # Poll cycles and change-stream events must not advance workflows concurrently
+        self._cycle_lock = asyncio.Lock()
+        self._watch_task: Optional[asyncio.Task] = None
+        
         logger.info(
             f"WorkflowExecutor initialized: "
             f"polling_interval={self.polling_interval}s, "
@@ -106,6 +127,9 @@ class WorkflowExecutor:
         
         self.scheduler.start()
         
+        if self.use_change_streams:
+            self._watch_task = asyncio.create_task(self.watch_pending_workflows())
+        
         logger.info(
             f"Workflow executor started (polling every {self.polling_interval}s)"
         )
@@ -115,9 +139,19 @@ class WorkflowExecutor:
         logger.info("Stopping workflow executor...")
         self._shutdown = True
         
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+        
         if self.scheduler.running:
             self.scheduler.shutdown(wait=True)
         
+        self.create_group_handler.close()
+        
         # Close all workflow loggers
         for workflow_id in list(self.active_workflows.keys()):
             WorkflowLogger.close_logger(workflow_id)
@@ -131,6 +165,9 @@ class WorkflowExecutor:
             
             # Get workflows in running or queued state
             workflows = self.state_manager.get_active_workflows()
+            auth_docs = self.state_manager.get_workflow_auths(
+                [workflow_doc['workflow_id'] for workflow_doc in workflows]
+            )
             
             resumed_count = 0
             for workflow_doc in workflows:
@@ -141,7 +178,8 @@ class WorkflowExecutor:
                     # Build execution context
                     ctx = WorkflowExecutionContext.build_from_workflow_document(
                         workflow_doc,
-                        log_dir=self.config.logging.get('workflow_log_dir', 'logs/workflows')
+                        log_dir=self.config.logging.get('workflow_log_dir', 'logs/workflows'),
+                        auth_doc=auth_docs.get(workflow_id)
                     )
                     
                     # Add to active workflows
@@ -176,6 +214,12 @@ class WorkflowExecutor:
         if self._shutdown:
             return
         
+        # Serialize with change-stream driven processing
+        async with self._cycle_lock:
+            await self._run_poll_cycle()
+    
+    async def _run_poll_cycle(self) -> None:
+        """Load pending workflows and advance every active workflow once."""
         poll_start_time = time.time()
         
         try:
@@ -216,47 +260,202 @@ class WorkflowExecutor:
         """Load workflows with status='pending' and create contexts."""
         try:
             pending_workflows = self.state_manager.get_workflows_by_status('pending')
+            auth_docs = self.state_manager.get_workflow_auths([
+                workflow_doc['workflow_id']
+                for workflow_doc in pending_workflows
+                if workflow_doc['workflow_id'] not in self.active_workflows
+            ])
             
             for workflow_doc in pending_workflows:
-                workflow_id = workflow_doc['workflow_id']
-                
                 # Skip if already loaded
-                if workflow_id in self.active_workflows:
+                if workflow_doc['workflow_id'] in self.active_workflows:
                     continue
                 
-                try:
-                    logger.info(f"Loading pending workflow: {workflow_id}")
-                    
-                    # Build execution context
-                    ctx = WorkflowExecutionContext.build_from_workflow_document(
-                        workflow_doc,
-                        log_dir=self.config.logging.get('workflow_log_dir', 'logs/workflows')
-                    )
-                    
-                    # Add to active workflows
-                    self.active_workflows[workflow_id] = ctx
-                    
-                    # Update status to queued
-                    self.state_manager.update_workflow_status(workflow_id, 'queued')
-                    ctx.update_status('queued')
-                    
-                    # Log workflow start
-                    WorkflowLogger.log_workflow_start(
-                        ctx.workflow_logger,
-                        ctx.workflow_name,
-                        ctx.total_steps
+                self.load_pending_workflow(
+                    workflow_doc,
+                    auth_docs.get(workflow_doc['workflow_id'])
+                )
+        
+        except Exception as e:
+            logger.error(f"Error loading pending workflows: {e}", exc_info=True)
+    
+    def load_pending_workflow(
+        self,
+        workflow_doc: Dict[str, Any],
+        auth_doc: Optional[Dict[str, Any]] = None
+    ) -> Optional[WorkflowExecutionContext]:
+        """Queue one pending workflow and create its execution context.
+        
+        Args:
+            workflow_doc: Workflow document with status='pending'
+            auth_doc: Document from the workflow_auth collection, if any
+            
+        Returns:
+            The new execution context, or None if the workflow was not queued
+        """
+        workflow_id = workflow_doc['workflow_id']
+        
+        try:
+            logger.info(f"Loading pending workflow: {workflow_id}")
+            
+            # Build execution context
+            ctx = WorkflowExecutionContext.build_from_workflow_document(
+                workflow_doc,
+                log_dir=self.config.logging.get('workflow_log_dir', 'logs/workflows'),
+                auth_doc=auth_doc
+            )
+            
+            # Update status to queued (only if still pending, so a
+            # cancellation that raced this poll is not overwritten)
+            queued = self.state_manager.update_workflow_status(
+                workflow_id,
+                'queued',
+                allowed_current_statuses=['pending']
+            )
+            if not queued:
+                logger.info(
+                    f"Workflow {workflow_id} is no longer pending, skipping"
+                )
+                return None
+            
+            # Add to active workflows
+            self.active_workflows[workflow_id] = ctx
+            ctx.update_status('queued')
+            
+            # Log workflow start
+            WorkflowLogger.log_workflow_start(
+                ctx.workflow_logger,
+                ctx.workflow_name,
+                ctx.total_steps
+            )
+            
+            logger.info(f"Workflow {workflow_id} queued for execution")
+            return ctx
+        
+        except Exception as e:
+            logger.error(
+                f"Failed to load workflow {workflow_id}: {e}",
+                exc_info=True
+            )
+            return None
+    
+    async def watch_pending_workflows(self) -> None:
+        """Start newly pending workflows as soon as they are written.
+        
+        Tails a MongoDB change stream for workflows entering 'pending' and
+        loads and processes each one immediately instead of waiting for the
+        next poll. The resume token is persisted after every handled event so
+        a restarted executor continues where it left off. Polling keeps running
+        as a fallback, and is the only path when change streams are not
+        supported (e.g. a standalone mongod without a replica set).
+        
+        A persisted resume token the server no longer accepts is dropped and
+        the stream reopened from the current time. Other errors, including
+        transient MongoDB failures, are retried with capped exponential
+        backoff; only a deployment without change stream support stops the
+        watcher.
+        """
+        failures = 0
+        discard_token = False
+        while not self._shutdown:
+            try:
+                if discard_token:
+                    await asyncio.to_thread(
+                        self.state_manager.clear_resume_token,
+                        PENDING_WATCH_NAME
                     )
-                    
-                    logger.info(f"Workflow {workflow_id} queued for execution")
+                    discard_token = False
+                resume_token = await asyncio.to_thread(
+                    self.state_manager.get_resume_token,
+                    PENDING_WATCH_NAME
+                )
+                stream = await asyncio.to_thread(
+                    self.state_manager.watch_pending_workflows,
+                    resume_token
+                )
                 
-                except Exception as e:
+                logger.info("Watching for pending workflows via change stream")
+                failures = 0
+                with stream:
+                    while not self._shutdown:
+                        # Blocks for at most max_await_time_ms
+                        change = await asyncio.to_thread(stream.try_next)
+                        if change is None:
+                            continue
+                        await self._handle_pending_change(change)
+                        await asyncio.to_thread(
+                            self.state_manager.save_resume_token,
+                            PENDING_WATCH_NAME,
+                            stream.resume_token
+                        )
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if e.code in CHANGE_STREAM_UNSUPPORTED_CODES:
+                    logger.warning(
+                        f"Change streams unavailable, relying on polling only: {e}"
+                    )
+                    return
+                if e.code in RESUME_TOKEN_REJECTED_CODES:
+                    # Polling covers anything that went pending in between
+                    logger.warning(
+                        f"Pending workflow resume token no longer valid, "
+                        f"watching from now: {e}"
+                    )
+                    discard_token = True
+                else:
                     logger.error(
-                        f"Failed to load workflow {workflow_id}: {e}",
+                        f"Pending workflow change stream failed, reopening: {e}",
                         exc_info=True
                     )
+                failures += 1
+            except Exception as e:
+                logger.error(
+                    f"Pending workflow change stream failed, reopening: {e}",
+                    exc_info=True
+                )
+                failures += 1
+            
+            if not self._shutdown:
+                await asyncio.sleep(min(
+                    self.polling_interval * 2 ** (failures - 1),
+                    CHANGE_STREAM_MAX_BACKOFF_SECONDS
+                ))
+    
+    async def _handle_pending_change(self, change: Dict[str, Any]) -> None:
+        """Load and start a workflow reported by the pending change stream.
         
-        except Exception as e:
-            logger.error(f"Error loading pending workflows: {e}", exc_info=True)
+        Args:
+            change: Change stream event with fullDocument
+        """
+        workflow_doc = change.get('fullDocument')
+        if not workflow_doc or workflow_doc.get('status') != 'pending':
+            return
+        
+        workflow_id = workflow_doc['workflow_id']
+        workflow_doc.pop('_id', None)
+        
+        async with self._cycle_lock:
+            if workflow_id in self.active_workflows:
+                return
+            
+            ctx = self.load_pending_workflow(
+                workflow_doc,
+                self.state_manager.get_workflow_auth(workflow_id)
+            )
+            if ctx is None:
+                return
+            
+            try:
+                await self.process_workflow(ctx)
+            except Exception as e:
+                logger.error(
+                    f"Error processing workflow {workflow_id}: {e}",
+                    exc_info=True
+                )
+                await self.handle_workflow_error(workflow_id, str(e))
+            
+            metrics.update_active_workflows(len(self.active_workflows))
     
     async def process_workflow(self, ctx: WorkflowExecutionContext) -> None:
         """Process a single workflow.
@@ -267,7 +466,7 @@ class WorkflowExecutor:
         workflow_id = ctx.workflow_id
         
         # Update poll time
-        ctx.last_poll_time = datetime.utcnow()
+        ctx.last_poll_time = datetime.now(timezone.utc)
         
         # Check if workflow was cancelled
         if ctx.status == 'cancelled':
@@ -293,7 +492,7 @@ class WorkflowExecutor:
                 workflow_id,
                 {
                     'status': 'running',
-                    'started_at': datetime.utcnow()
+                    'started_at': datetime.now(timezone.utc)
                 }
             )
             ctx.update_status('running')
@@ -439,7 +638,8 @@ class WorkflowExecutor:
                 dag=ctx.dag,
                 mark_step_running=ctx.mark_step_running,
                 mark_step_completed=ctx.mark_step_completed,
-                mark_step_failed=ctx.mark_step_failed
+                mark_step_failed=ctx.mark_step_failed,
+                workflow_steps=ctx.get_workflow_steps()
             )
             return
         
@@ -447,9 +647,10 @@ class WorkflowExecutor:
         
         # Log the step details before resolution
         logger.info(
-            f"Workflow {workflow_id}: Step '{step_name}' details before runtime resolution:\n"
-            f"  App: {app}\n"
-            f"  Params: {json.dumps(params, indent=2)}"
+            "Workflow %s: Step '%s' details before runtime resolution:\n"
+            "  App: %s\n"
+            "  Params: %s",
+            workflow_id, step_name, app, LazyJson(params)
         )
         
         try:
@@ -463,8 +664,9 @@ class WorkflowExecutor:
                     workflow_steps
                 )
                 logger.info(
-                    f"Workflow {workflow_id}: Resolved params for step '{step_name}' after runtime resolution:\n"
-                    f"  Params: {json.dumps(params, indent=2)}"
+                    "Workflow %s: Resolved params for step '%s' after runtime resolution:\n"
+                    "  Params: %s",
+                    workflow_id, step_name, LazyJson(params)
                 )
             
             # Defensive check: Validate critical parameters before submission
@@ -589,10 +791,11 @@ class WorkflowExecutor:
             
             # Log the full job spec being sent to scheduler
             logger.info(
-                f"Workflow {workflow_id}: Full job spec being sent to scheduler for step '{step_name}':\n"
-                f"  App: {app}\n"
-                f"  Params: {json.dumps(params, indent=2)}\n"
-                f"  Auth token present: {bool(ctx.auth_token)}"
+                "Workflow %s: Full job spec being sent to scheduler for step '%s':\n"
+                "  App: %s\n"
+                "  Params: %s\n"
+                "  Auth token present: %s",
+                workflow_id, step_name, app, LazyJson(params), bool(ctx.auth_token)
             )
             
             # Submit to scheduler
@@ -618,7 +821,7 @@ class WorkflowExecutor:
                     'step_id': step_id,
                     'task_id': task_id,
                     'status': 'running',
-                    'submitted_at': datetime.utcnow()
+                    'submitted_at': datetime.now(timezone.utc)
                 }
             )
             
@@ -685,7 +888,7 @@ class WorkflowExecutor:
             step_id,
             {
                 'status': 'succeeded',
-                'completed_at': datetime.utcnow(),
+                'completed_at': datetime.now(timezone.utc),
                 'elapsed_time': elapsed_time
             }
         )
@@ -701,7 +904,7 @@ class WorkflowExecutor:
         node_id = step_name
         if node_id in ctx.dag.nodes:
             ctx.dag.nodes[node_id]['status'] = 'succeeded'
-            ctx.dag.nodes[node_id]['completed_at'] = datetime.utcnow()
+            ctx.dag.nodes[node_id]['completed_at'] = datetime.now(timezone.utc)
         
         # Log completion
         WorkflowLogger.log_step_completion(
@@ -750,7 +953,7 @@ class WorkflowExecutor:
             step_id,
             {
                 'status': 'failed',
-                'completed_at': datetime.utcnow(),
+                'completed_at': datetime.now(timezone.utc),
                 'error_message': error_message
             }
         )
@@ -809,7 +1012,7 @@ class WorkflowExecutor:
             {
                 'status': 'failed',
                 'error_message': f"Submission failed: {error_message}",
-                'completed_at': datetime.utcnow()
+                'completed_at': datetime.now(timezone.utc)
             }
         )
         
@@ -858,7 +1061,7 @@ class WorkflowExecutor:
         duration_str = None
         
         if started_at:
-            duration = datetime.utcnow() - started_at
+            duration = datetime.now(timezone.utc) - started_at
             duration_seconds = duration.total_seconds()
             duration_str = str(duration)
             
@@ -870,7 +1073,7 @@ class WorkflowExecutor:
             workflow_id,
             {
                 'status': final_status,
-                'completed_at': datetime.utcnow()
+                'completed_at': datetime.now(timezone.utc)
             }
         )
         
@@ -939,7 +1142,7 @@ class WorkflowExecutor:
                 {
                     'status': 'failed',
                     'error_message': f"Executor error: {error_message}",
-                    'completed_at': datetime.utcnow()
+                    'completed_at': datetime.now(timezone.utc)
                 }
             )
             
@@ -1,10 +1,15 @@
 """Workflow data models using Pydantic."""
 from typing import Dict, List, Any, Optional
 from pydantic import BaseModel, Field, field_validator
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
 
+def _utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 class BaseContext(BaseModel):
     """Base context for workflow execution."""
     base_url: str
@@ -82,14 +87,16 @@ class WorkflowSubmission(BaseModel):
 
     # Status and timestamps
     status: str = "pending"
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_utc_now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
     # Execution tracking
     execution_metadata: Optional[ExecutionMetadata] = None
-    auth_token: Optional[str] = None  # Stored plaintext for now (TODO: encrypt)
+    auth_token: Optional[str] = None  # Plaintext only when no encryption key is configured
+    auth_token_enc: Optional[str] = None  # Fernet-encrypted auth token
+    auth_token_fingerprint: Optional[str] = None  # Non-reversible token ID for logs
     log_file_path: Optional[str] = None
     error_message: Optional[str] = None
 
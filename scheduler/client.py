@@ -1,12 +1,11 @@
 """Scheduler client for submitting jobs via JSON-RPC."""
-import json
-import time
-import random
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from utils.json_codec import LazyJson
 from utils.logger import get_logger, setup_logger
-from utils.jsonrpc_client import JSONRPCClient
+from utils.jsonrpc_client import JSONRPCClient, close_http_session
+from utils.ulid import new_ulid
 from models.workflow import WorkflowDefinition
 
 
@@ -210,10 +209,11 @@ class SchedulerClient:
         
         # Log the full job spec being sent
         logger.info(
-            f"Full job spec being sent to scheduler:\n"
-            f"  App: {app}\n"
-            f"  Params: {json.dumps(params, indent=2)}\n"
-            f"  Auth token present: {bool(auth_token)}"
+            "Full job spec being sent to scheduler:\n"
+            "  App: %s\n"
+            "  Params: %s\n"
+            "  Auth token present: %s",
+            app, LazyJson(params), bool(auth_token)
         )
         
         # Create a temporary JSON-RPC client with the provided auth token
@@ -373,6 +373,10 @@ class SchedulerClient:
         
         return True
     
+    def close(self) -> None:
+        """Release pooled HTTP connections used for scheduler calls."""
+        close_http_session()
+    
     @staticmethod
     def _generate_workflow_id() -> str:
         """Generate mock workflow ID.
@@ -380,9 +384,7 @@ class SchedulerClient:
         Returns:
             Workflow ID string
         """
-        timestamp = int(time.time() * 1000)
-        random_part = random.randint(1000, 9999)
-        return f"wf_{timestamp}_{random_part}"
+        return f"wf_{new_ulid()}"
     
     @staticmethod
     def _generate_step_id(index: int) -> str:
@@ -394,9 +396,7 @@ class SchedulerClient:
         Returns:
             Step ID string
         """
-        timestamp = int(time.time() * 1000)
-        random_part = random.randint(1000, 9999)
-        return f"step_{timestamp}_{index}_{random_part}"
+        return f"step_{new_ulid()}_{index}"
     
     @staticmethod
     def _generate_task_id(step_id: str) -> str:
@@ -408,9 +408,7 @@ class SchedulerClient:
         Returns:
             Task ID string
         """
-        timestamp = int(time.time() * 1000)
-        random_part = random.randint(1000, 9999)
-        return f"task_{timestamp}_{random_part}"
+        return f"task_{new_ulid()}"
     
     @staticmethod
     def _transform_dependencies(steps: list) -> None:
@@ -0,0 +1,132 @@
+"""JSON encoding helpers backed by orjson when it is installed."""
+import json
+from typing import Any, Callable, Dict, Optional
+
+# Import orjson (optional dependency)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    # Match stdlib behaviour for non-string keys and let callers tag datetimes
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def dumps(
+    obj: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+    indent: bool = False,
+    sort_keys: bool = False
+) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        default: Hook for objects JSON cannot encode natively (including datetimes)
+        indent: Pretty-print with two-space indentation
+        sort_keys: Emit object keys in sorted order
+
+    Returns:
+        JSON string
+    """
+    return dumps_bytes(
+        obj, default=default, indent=indent, sort_keys=sort_keys
+    ).decode('utf-8')
+
+
+def dumps_bytes(
+    obj: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+    indent: bool = False,
+    sort_keys: bool = False
+) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        default: Hook for objects JSON cannot encode natively (including datetimes)
+        indent: Pretty-print with two-space indentation
+        sort_keys: Emit object keys in sorted order
+
+    Returns:
+        JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        options = _ORJSON_OPTIONS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        if sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=options)
+
+    return json.dumps(
+        obj,
+        default=default,
+        indent=2 if indent else None,
+        sort_keys=sort_keys
+    ).encode('utf-8')
+
+
+def loads(
+    data: Any,
+    object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON str or bytes
+        object_hook: Optional hook applied to every decoded object, innermost first
+
+    Returns:
+        Decoded Python object
+    """
+    if not ORJSON_AVAILABLE:
+        return json.loads(data, object_hook=object_hook)
+
+    value = orjson.loads(data)
+    if object_hook is None:
+        return value
+    return _apply_object_hook(value, object_hook)
+
+
+def _apply_object_hook(value: Any, object_hook: Callable[[Dict[str, Any]], Any]) -> Any:
+    """Apply an object hook bottom-up, mirroring json.loads(object_hook=...)."""
+    if isinstance(value, dict):
+        return object_hook({
+            key: _apply_object_hook(item, object_hook)
+            for key, item in value.items()
+        })
+    if isinstance(value, list):
+        return [_apply_object_hook(item, object_hook) for item in value]
+    return value
+
+
+def json_copy(obj: Any) -> Any:
+    """Deep-copy a JSON-compatible structure via a serialize/parse round-trip.
+
+    Args:
+        obj: JSON-compatible object
+
+    Returns:
+        Independent copy of obj
+    """
+    return loads(dumps_bytes(obj))
+
+
+class LazyJson:
+    """Defers pretty-printing an object until a log record is emitted.
+
+    Pass as a %-style logging argument so that disabled log levels never
+    pay for serializing large workflow documents.
+    """
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return dumps(self.obj, default=str, indent=True)
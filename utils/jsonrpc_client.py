@@ -1,14 +1,64 @@
 """JSON-RPC client for submitting jobs to scheduler apps."""
 import json
+import threading
 import uuid
 import time
+from http.cookiejar import DefaultCookiePolicy
 from typing import Dict, Any, Optional, Union, List
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.json_codec import LazyJson, dumps_bytes, loads
 from utils.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+# Keep-alive pool shared by every JSONRPCClient (per-token clients included)
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 100
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Get the process-wide HTTP session used for JSON-RPC calls.
+
+    Reusing one session keeps TCP/TLS connections alive across calls instead
+    of reconnecting for every request. Cookies are never stored, since the
+    session is shared between requests made with different users' tokens.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                # Only connection failures are retried: the request never
+                # reached the server, so resending a job submission is safe
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=HTTP_POOL_MAXSIZE,
+                    max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2)
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def close_http_session() -> None:
+    """Close the shared HTTP session and release its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
 
 class JSONRPCClient:
     """Client for making JSON-RPC 2.0 requests to scheduler services."""
@@ -55,17 +105,6 @@ class JSONRPCClient:
         # Show a tiny prefix to correlate tokens across logs without leaking secrets.
         return f"{s[:6]}…<redacted>…{s[-4:]}"
 
-    @staticmethod
-    def _safe_json_loads(text: str) -> Optional[Dict[str, Any]]:
-        """Best-effort JSON parsing for debugging error responses."""
-        if not text:
-            return None
-        try:
-            parsed = json.loads(text)
-            return parsed if isinstance(parsed, dict) else {"_non_dict_json": parsed}
-        except Exception:
-            return None
-    
     def call(
         self,
         method: str,
@@ -131,21 +170,21 @@ class JSONRPCClient:
             
             # Log the full request payload at INFO level for debugging
             logger.info(
-                f"Full JSON-RPC request payload being sent to {self.base_url}:\n"
-                f"  Payload: {json.dumps(payload, indent=2)}"
+                "Full JSON-RPC request payload being sent to %s:\n  Payload: %s",
+                self.base_url, LazyJson(payload)
             )
             
             # Also log at DEBUG level
             logger.debug(
-                f"Full JSON-RPC request to {self.base_url}:\n"
-                f"  Payload: {json.dumps(payload, indent=2)}"
+                "Full JSON-RPC request to %s:\n  Payload: %s",
+                self.base_url, LazyJson(payload)
             )
             
             start_time = time.time()
             # Use explicit JSON serialization so Content-Type stays jsonrpc+json
-            response = requests.post(
+            response = get_http_session().post(
                 self.base_url,
-                data=json.dumps(payload),
+                data=dumps_bytes(payload),
                 headers=headers,
                 timeout=self.timeout
             )
@@ -160,7 +199,14 @@ class JSONRPCClient:
             
             # Try to get response body for error reporting
             response_text = response.text
-            response_json = self._safe_json_loads(response_text)
+
+            # Parse the body once; it serves both error reporting and the result
+            try:
+                parsed_body = loads(response.content)
+                parse_error = None
+            except ValueError as e:
+                parsed_body, parse_error = None, e
+            response_json = parsed_body if isinstance(parsed_body, dict) else None
 
             # Log response headers at DEBUG (can help identify upstream proxies / trace IDs)
             try:
@@ -202,20 +248,20 @@ class JSONRPCClient:
                 response.raise_for_status()
             
             # Parse JSON-RPC response
-            try:
-                result = response.json()
-            except json.JSONDecodeError as e:
+            if parse_error is not None:
                 logger.error(
                     f"Failed to parse JSON response from {self.base_url}:\n"
                     f"  Response text: {response_text}\n"
-                    f"  Parse error: {e}"
+                    f"  Parse error: {parse_error}"
                 )
-                raise ValueError(f"Invalid JSON response: {e}")
+                raise ValueError(f"Invalid JSON response: {parse_error}")
+            result = parsed_body
             
             # Log the full JSON-RPC response envelope at DEBUG level
             logger.debug(
-                f"Full JSON-RPC response:\n"
-                f"  Response: {json.dumps(result, indent=2)}"
+                "Full JSON-RPC response:\n"
+                "  Response: %s",
+                LazyJson(result)
             )
             
             # Check for JSON-RPC error
@@ -309,22 +355,24 @@ class JSONRPCClient:
         
         # Log full job spec at INFO level for debugging
         logger.info(
-            f"Full job spec being sent to workflow engine (JSON-RPC):\n"
-            f"  Method: {method}\n"
-            f"  App: {app}\n"
-            f"  Params: {json.dumps(params, indent=2)}\n"
-            f"  Base URL: https://www.bv-brc.org\n"
-            f"  Auth token present: {bool(self.auth_token)}"
+            "Full job spec being sent to workflow engine (JSON-RPC):\n"
+            "  Method: %s\n"
+            "  App: %s\n"
+            "  Params: %s\n"
+            "  Base URL: https://www.bv-brc.org\n"
+            "  Auth token present: %s",
+            method, app, LazyJson(params), bool(self.auth_token)
         )
         
         # Also log at DEBUG level with additional details
         logger.debug(
-            f"Job submission details:\n"
-            f"  Method: {method}\n"
-            f"  App: {app}\n"
-            f"  Params: {json.dumps(params, indent=2)}\n"
-            f"  Base URL: https://www.bv-brc.org\n"
-            f"  Auth token present: {bool(self.auth_token)}"
+            "Job submission details:\n"
+            "  Method: %s\n"
+            "  App: %s\n"
+            "  Params: %s\n"
+            "  Base URL: https://www.bv-brc.org\n"
+            "  Auth token present: %s",
+            method, app, LazyJson(params), bool(self.auth_token)
         )
         
         # Make JSON-RPC call
@@ -332,9 +380,12 @@ class JSONRPCClient:
         
         # Log the actual result at DEBUG level
         logger.debug(
-            f"Result from {method}:\n"
-            f"  Type: {type(result)}\n"
-            f"  Value: {json.dumps(result, indent=2) if isinstance(result, (dict, list)) else result}"
+            "Result from %s:\n"
+            "  Type: %s\n"
+            "  Value: %s",
+            method,
+            type(result),
+            LazyJson(result) if isinstance(result, (dict, list)) else result
         )
         
         # Handle response format: BV-BRC returns a list with one dict
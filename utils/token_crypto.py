@@ -0,0 +1,124 @@
+"""Encryption of auth tokens stored with workflow documents."""
+import hashlib
+from typing import Dict, Any, Optional
+
+from config.config import config
+from utils.logger import get_logger
+
+# Import Fernet (optional dependency)
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+
+logger = get_logger(__name__)
+
+
+class AuthTokenCipher:
+    """Encrypts auth tokens at rest with Fernet.
+
+    When no key is configured or the cryptography package is missing,
+    tokens are stored in plaintext under 'auth_token' as before. Documents
+    written either way can always be read back with reveal().
+    """
+
+    def __init__(self, key: Optional[str] = None):
+        """Initialize cipher.
+
+        Args:
+            key: URL-safe base64 Fernet key (see Fernet.generate_key())
+        """
+        self._fernet = None
+
+        if not key:
+            logger.warning(
+                "No auth token encryption key configured - tokens are stored in plaintext"
+            )
+            return
+
+        if not CRYPTOGRAPHY_AVAILABLE:
+            logger.warning(
+                "cryptography package not available - tokens are stored in plaintext"
+            )
+            return
+
+        self._fernet = Fernet(key.encode() if isinstance(key, str) else key)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether tokens are encrypted before storage."""
+        return self._fernet is not None
+
+    @staticmethod
+    def fingerprint(auth_token: str) -> str:
+        """Short, non-reversible token identifier safe to log.
+
+        Args:
+            auth_token: Raw auth token
+
+        Returns:
+            16-character hex digest
+        """
+        return hashlib.blake2b(auth_token.encode('utf-8'), digest_size=8).hexdigest()
+
+    def protect(self, auth_token: str) -> Dict[str, str]:
+        """Build the document fields that store an auth token.
+
+        Args:
+            auth_token: Raw auth token
+
+        Returns:
+            Fields to merge into the stored document
+        """
+        fields = {'auth_token_fingerprint': self.fingerprint(auth_token)}
+        if self._fernet is not None:
+            fields['auth_token_enc'] = self._fernet.encrypt(
+                auth_token.encode('utf-8')
+            ).decode('ascii')
+        else:
+            fields['auth_token'] = auth_token
+        return fields
+
+    def reveal(self, document: Dict[str, Any]) -> Optional[str]:
+        """Recover the raw auth token from a stored document.
+
+        Args:
+            document: Document written with protect() (or a legacy plaintext one)
+
+        Returns:
+            Raw auth token, or None if absent or undecryptable
+        """
+        encrypted = document.get('auth_token_enc')
+        if encrypted:
+            if self._fernet is None:
+                logger.error(
+                    "Stored auth token is encrypted but no decryption key is configured"
+                )
+                return None
+            try:
+                return self._fernet.decrypt(encrypted.encode('ascii')).decode('utf-8')
+            except InvalidToken:
+                logger.error(
+                    f"Failed to decrypt auth token "
+                    f"(fingerprint={document.get('auth_token_fingerprint')})"
+                )
+                return None
+
+        return document.get('auth_token')
+
+
+_cipher: Optional[AuthTokenCipher] = None
+
+
+def get_token_cipher() -> AuthTokenCipher:
+    """Get the process-wide cipher built from the security configuration.
+
+    Returns:
+        Shared AuthTokenCipher instance
+    """
+    global _cipher
+    if _cipher is None:
+        _cipher = AuthTokenCipher(config.security.get('auth_token_key'))
+    return _cipher
@@ -0,0 +1,50 @@
+"""Monotonic ULID generation for lexicographically sortable identifiers."""
+import os
+import threading
+import time
+
+
+# Crockford base32 alphabet used by the ULID spec
+_CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+
+_lock = threading.Lock()
+_last_timestamp_ms = -1
+_last_random = 0
+
+
+def _encode(value: int, length: int) -> str:
+    """Encode an integer as a fixed-length Crockford base32 string."""
+    chars = []
+    for _ in range(length):
+        chars.append(_CROCKFORD_ALPHABET[value & 0x1F])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def new_ulid() -> str:
+    """Generate a monotonic ULID string.
+
+    ULIDs are 26 characters: a 48-bit millisecond timestamp followed by
+    80 random bits. Within the same millisecond the random part is
+    incremented instead of redrawn, so IDs from this process sort strictly
+    in creation order.
+
+    Returns:
+        26-character ULID string
+    """
+    global _last_timestamp_ms, _last_random
+
+    with _lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms <= _last_timestamp_ms and _last_random < _RANDOM_MAX:
+            timestamp_ms = _last_timestamp_ms
+            random_part = _last_random + 1
+        else:
+            random_part = int.from_bytes(os.urandom(10), "big")
+        _last_timestamp_ms = timestamp_ms
+        _last_random = random_part
+
+    return _encode(timestamp_ms, 10) + _encode(random_part, 16)
@@ -1,4 +1,5 @@
 """Variable resolver for workflow JSON placeholders."""
+import os
 import re
 from typing import Dict, Any, Union, List
 from utils.logger import get_logger
@@ -48,12 +49,11 @@ class VariableResolver:
         """
         logger.info("Starting multi-pass variable resolution")
         
-        # Make a deep copy to avoid modifying the original
-        resolved_workflow = VariableResolver._deep_copy(workflow_data)
-        
-        # PASS 1: Resolve base_context variables
+        # PASS 1: Resolve base_context variables. This walk rebuilds every
+        # dict and list it visits, so it doubles as the defensive deep copy
+        # and the original is never modified by the later in-place passes.
         logger.info("Pass 1: Resolving base_context variables")
-        resolved_workflow = VariableResolver._resolve_base_context_variables(resolved_workflow)
+        resolved_workflow = VariableResolver._resolve_base_context_variables(workflow_data)
         
         # PASS 2: Resolve params references within each step
         logger.info("Pass 2: Resolving params references within each step")
@@ -331,7 +331,7 @@ class VariableResolver:
             for key, value in obj.items():
                 # Skip resolving base_context itself to avoid circular issues
                 if key == 'base_context':
-                    resolved[key] = value
+                    resolved[key] = VariableResolver._deep_copy(value)
                 else:
                     resolved[key] = VariableResolver._resolve_simple_variables_recursive(
                         value,
@@ -401,7 +401,6 @@ class VariableResolver:
                 )
             else:
                 # Try environment variable as fallback
-                import os
                 env_value = os.getenv(var_name)
                 if env_value:
                     resolved = resolved.replace(f"${{{var_name}}}", env_value)
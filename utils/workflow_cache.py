@@ -0,0 +1,180 @@
+"""Read-through cache for workflow documents."""
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from utils.json_codec import dumps_bytes, loads
+from utils.logger import get_logger
+
+# Import Redis client (optional dependency)
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+logger = get_logger(__name__)
+
+TERMINAL_WORKFLOW_STATUSES = frozenset({'succeeded', 'failed', 'cancelled'})
+
+
+def _encode_value(value: Any) -> Any:
+    """JSON encoder hook that tags datetimes so they survive a round-trip."""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    """JSON object hook that restores datetimes tagged by _encode_value."""
+    if len(obj) == 1 and '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    return obj
+
+
+class WorkflowCache:
+    """Redis-backed cache of workflow documents keyed by workflow_id.
+
+    The cache is disabled (every lookup misses) when no Redis URL is
+    configured or the redis package is not installed, so callers can use
+    it unconditionally. MongoDB remains the source of truth.
+    """
+
+    KEY_PREFIX = "wf:"
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        active_ttl_seconds: int = 30,
+        terminal_ttl_seconds: int = 3600
+    ):
+        """Initialize workflow cache.
+
+        Args:
+            url: Redis connection URL (e.g. redis://localhost:6379/0)
+            active_ttl_seconds: TTL for workflows that can still change
+            terminal_ttl_seconds: TTL for succeeded/failed/cancelled workflows
+        """
+        self.active_ttl_seconds = active_ttl_seconds
+        self.terminal_ttl_seconds = terminal_ttl_seconds
+        self.client = None
+
+        if not url:
+            logger.info("Workflow cache disabled - no Redis URL configured")
+            return
+
+        if not REDIS_AVAILABLE:
+            logger.warning(
+                "redis package not available - workflow cache disabled"
+            )
+            return
+
+        try:
+            self.client = redis.Redis.from_url(url)
+            logger.info(f"Workflow cache enabled: {url}")
+        except Exception as e:
+            logger.warning(f"Failed to initialize workflow cache: {e}")
+            self.client = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Redis client is configured."""
+        return self.client is not None
+
+    def _key(self, workflow_id: str) -> str:
+        """Build the cache key for a workflow."""
+        return f"{self.KEY_PREFIX}{workflow_id}"
+
+    def get(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Get a cached workflow document.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            Cached workflow document, or None on miss or cache error
+        """
+        if not self.client:
+            return None
+
+        try:
+            payload = self.client.get(self._key(workflow_id))
+        except Exception as e:
+            logger.warning(f"Workflow cache get failed for {workflow_id}: {e}")
+            return None
+
+        if payload is None:
+            return None
+        return loads(payload, object_hook=_decode_object)
+
+    def get_many(self, workflow_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several cached workflow documents with a single MGET.
+
+        Args:
+            workflow_ids: Workflow identifiers
+
+        Returns:
+            Mapping of workflow_id to document for cache hits only
+        """
+        if not self.client or not workflow_ids:
+            return {}
+
+        try:
+            payloads = self.client.mget([self._key(wid) for wid in workflow_ids])
+        except Exception as e:
+            logger.warning(f"Workflow cache mget failed: {e}")
+            return {}
+
+        return {
+            workflow_id: loads(payload, object_hook=_decode_object)
+            for workflow_id, payload in zip(workflow_ids, payloads)
+            if payload is not None
+        }
+
+    def set(self, workflow: Dict[str, Any]) -> None:
+        """Cache a workflow document.
+
+        Terminal workflows are kept longer since they no longer change.
+
+        Args:
+            workflow: Workflow document (must contain workflow_id)
+        """
+        if not self.client:
+            return
+
+        workflow_id = workflow.get('workflow_id')
+        if not workflow_id:
+            return
+
+        if workflow.get('status') in TERMINAL_WORKFLOW_STATUSES:
+            ttl = self.terminal_ttl_seconds
+        else:
+            ttl = self.active_ttl_seconds
+
+        try:
+            self.client.set(
+                self._key(workflow_id),
+                dumps_bytes(workflow, default=_encode_value),
+                ex=ttl
+            )
+        except Exception as e:
+            logger.warning(f"Workflow cache set failed for {workflow_id}: {e}")
+
+    def invalidate(self, workflow_id: str) -> None:
+        """Drop a cached workflow document after it was mutated.
+
+        Args:
+            workflow_id: Workflow identifier
+        """
+        if not self.client:
+            return
+
+        try:
+            self.client.delete(self._key(workflow_id))
+        except Exception as e:
+            logger.warning(f"Workflow cache invalidate failed for {workflow_id}: {e}")
+
+    def close(self) -> None:
+        """Close the Redis connection pool."""
+        if self.client:
+            self.client.close()
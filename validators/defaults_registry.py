@@ -21,6 +21,8 @@ class DefaultsRegistry:
     def __init__(self):
         """Initialize the defaults registry."""
         self._defaults: Dict[str, Type[BaseDefaults]] = {}
+        # Instances are stateless, so one per app is built lazily and reused
+        self._instances: Dict[str, BaseDefaults] = {}
     
     def register(
         self,
@@ -43,6 +45,7 @@ class DefaultsRegistry:
             )
         
         self._defaults[app_name] = defaults_class
+        self._instances.pop(app_name, None)
         logger.info(f"Registered defaults provider for app: {app_name}")
     
     def get(self, app_name: str) -> Optional[BaseDefaults]:
@@ -53,11 +56,17 @@ class DefaultsRegistry:
             app_name: Application/service name
         
         Returns:
-            Defaults provider instance or None if not found
+            Shared defaults provider instance or None if not found
         """
+        instance = self._instances.get(app_name)
+        if instance is not None:
+            return instance
+        
         defaults_class = self._defaults.get(app_name)
         if defaults_class:
-            return defaults_class()
+            instance = defaults_class()
+            self._instances[app_name] = instance
+            return instance
         return None
     
     def is_registered(self, app_name: str) -> bool:
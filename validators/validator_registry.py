@@ -21,6 +21,8 @@ class ValidatorRegistry:
     def __init__(self):
         """Initialize the validator registry."""
         self._validators: Dict[str, Type[BaseStepValidator]] = {}
+        # Instances are stateless, so one per app is built lazily and reused
+        self._instances: Dict[str, BaseStepValidator] = {}
     
     def register(
         self,
@@ -43,6 +45,7 @@ class ValidatorRegistry:
             )
         
         self._validators[app_name] = validator_class
+        self._instances.pop(app_name, None)
         logger.info(f"Registered validator for app: {app_name}")
     
     def get(self, app_name: str) -> Optional[BaseStepValidator]:
@@ -53,11 +56,17 @@ class ValidatorRegistry:
             app_name: Application/service name
         
         Returns:
-            Validator instance or None if not found
+            Shared validator instance or None if not found
         """
+        instance = self._instances.get(app_name)
+        if instance is not None:
+            return instance
+        
         validator_class = self._validators.get(app_name)
         if validator_class:
-            return validator_class()
+            instance = validator_class()
+            self._instances[app_name] = instance
+            return instance
         return None
     
     def is_registered(self, app_name: str) -> bool: